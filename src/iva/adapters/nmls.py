@@ -9,7 +9,7 @@ async def check_nmls(company: str) -> list[AdapterFinding]:
     return [
         AdapterFinding(
             key="us_mtl_states",
-            value="['CA','NY','TX','WA','IL','FL','MA','CO','VA','PA','OH','NJ','GA','AZ']",
+            value='["CA","NY","TX","WA","IL","FL","MA","CO","VA","PA","OH","NJ","GA","AZ"]',
             status="confirmed",
             adapter="nmls",
             observed_at=datetime.now(UTC),
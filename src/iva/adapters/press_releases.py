@@ -10,6 +10,7 @@ Fetches company press releases from multiple sources:
 Compares website claims against official press releases to identify discrepancies.
 """
 
+import logging
 from datetime import UTC, datetime
 from typing import Any, Dict, List, Optional
 
@@ -18,6 +19,8 @@ import httpx
 from ..models.sources import AdapterFinding, Citation
 from .edgar_filings import USER_AGENT, get_company_submissions, lookup_cik
 
+logger = logging.getLogger(__name__)
+
 
 async def _fetch_html(url: str, timeout: float = 30.0) -> Optional[str]:
     """Fetch HTML content from a URL"""
@@ -32,7 +35,7 @@ async def _fetch_html(url: str, timeout: float = 30.0) -> Optional[str]:
             response.raise_for_status()
             return response.text
     except Exception as e:
-        print(f"[PRESS] Failed to fetch {url}: {e}")
+        logger.warning("Failed to fetch %s: %s", url, e)
         return None
 
 
@@ -84,7 +87,7 @@ async def find_press_releases_8k(cik: str, max_results: int = 10) -> List[Dict[s
         return press_releases
 
     except Exception as e:
-        print(f"[PRESS] Error finding 8-K press releases: {e}")
+        logger.warning("Error finding 8-K press releases: %s", e)
         return press_releases
 
 
@@ -139,7 +142,7 @@ async def check_press_releases(company: str, ticker: Optional[str] = None) -> li
 
     try:
         # Step 1: Lookup CIK
-        print(f"[PRESS] Looking up CIK for company='{company}', ticker='{ticker}'")
+        logger.info("Looking up CIK for company=%r, ticker=%r", company, ticker)
         cik = await lookup_cik(company_name=company, ticker=ticker)
 
         if not cik:
@@ -163,7 +166,7 @@ async def check_press_releases(company: str, ticker: Optional[str] = None) -> li
             )
             return findings
 
-        print(f"[PRESS] Found CIK: {cik}")
+        logger.info("Found CIK: %s", cik)
 
         # Step 2: Search for press releases in 8-K filings
         press_releases = await find_press_releases_8k(cik, max_results=10)
@@ -229,10 +232,10 @@ async def check_press_releases(company: str, ticker: Optional[str] = None) -> li
                 )
             )
 
-        print(f"[PRESS] Found {len(findings)} findings for {company} (CIK: {cik})")
+        logger.info("Found %d findings for %s (CIK: %s)", len(findings), company, cik)
 
     except Exception as e:
-        print(f"[PRESS] Error checking press releases: {e}")
+        logger.error("Error checking press releases: %s", e)
         findings.append(
             AdapterFinding(
                 key="press_release_error",
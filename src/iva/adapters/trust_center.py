@@ -27,6 +27,7 @@ def tls_expiry(domain: str):
 
 async def check_trust_center(base_url: str) -> list[AdapterFinding]:
     findings = []
+    now = datetime.now(UTC)
     has_sec, sec_url = await check_security_txt(base_url)
     findings.append(
         AdapterFinding(
@@ -34,14 +35,12 @@ async def check_trust_center(base_url: str) -> list[AdapterFinding]:
             value=str(has_sec),
             status="confirmed" if has_sec else "not_found",
             adapter="trust_center",
-            observed_at=datetime.now(UTC),
+            observed_at=now,
             snippet="security.txt contact information discovered"
             if has_sec
             else "security.txt endpoint missing",
             citations=[
-                Citation(
-                    source="security.txt", url=sec_url, query="", accessed_at=datetime.now(UTC)
-                )
+                Citation(source="security.txt", url=sec_url, query="", accessed_at=now)
             ],
         )
     )
@@ -53,12 +52,12 @@ async def check_trust_center(base_url: str) -> list[AdapterFinding]:
             value=str(exp),
             status="confirmed" if exp else "unknown",
             adapter="trust_center",
-            observed_at=datetime.now(UTC),
+            observed_at=now,
             snippet=f"TLS certificate expiry {exp}"
             if exp
             else "TLS certificate expiry unavailable",
             citations=[
-                Citation(source="TLS", url=base_url, query="", accessed_at=datetime.now(UTC))
+                Citation(source="TLS", url=base_url, query="", accessed_at=now)
             ],
         )
     )
@@ -5,12 +5,17 @@ Tracks changes in truth cards over time and generates alerts when material
 changes are detected (new high-severity discrepancies, significant metric changes, etc.).
 """
 
+import heapq
 import json
+import mmap
+import os
 from datetime import UTC, datetime
 from enum import Enum
+from operator import itemgetter
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+import orjson
 from pydantic import BaseModel
 
 from ..models.recon import TruthCard
@@ -40,6 +45,10 @@ class AlertType(str, Enum):
     HISTORICAL_CHANGE = "historical_change"
 
 
+_ALERT_TYPES = {e.value: e for e in AlertType}
+_SEVERITIES = {e.value: e for e in AlertSeverity}
+
+
 class AlertRule(BaseModel):
     """Rule for generating alerts"""
 
@@ -123,33 +132,41 @@ class AlertManager:
         if not alerts_file.exists():
             return []
 
-        alerts = []
-        with open(alerts_file, "r") as f:
-            for line in f:
-                if line.strip():
-                    record = json.loads(line)
-                    if unacknowledged_only and record.get("acknowledged", False):
-                        continue
-                    alerts.append(
-                        Alert(
-                            id=record["id"],
-                            company=record["company"],
-                            alert_type=AlertType(record["alert_type"]),
-                            severity=AlertSeverity(record["severity"]),
-                            message=record["message"],
-                            details=record["details"],
-                            generated_at=datetime.fromisoformat(record["generated_at"]),
-                            truth_card_url=record.get("truth_card_url"),
-                            acknowledged=record.get("acknowledged", False),
-                            acknowledged_at=datetime.fromisoformat(record["acknowledged_at"])
-                            if record.get("acknowledged_at")
-                            else None,
-                        )
-                    )
-
-        # Sort by generated_at descending
-        alerts.sort(key=lambda x: x.generated_at, reverse=True)
-        return alerts[:limit]
+        def _records():
+            with open(alerts_file, "rb") as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    return
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    for line in iter(mm.readline, b""):
+                        if not line.strip():
+                            continue
+                        record = orjson.loads(line)
+                        if unacknowledged_only and record.get("acknowledged", False):
+                            continue
+                        record["generated_at"] = datetime.fromisoformat(record["generated_at"])
+                        yield record
+
+        # Most recent first; only the surviving `limit` records become Alert objects
+        latest = heapq.nlargest(limit, _records(), key=itemgetter("generated_at"))
+
+        # Records are written by save_alert, so skip re-validation
+        return [
+            Alert.model_construct(
+                id=record["id"],
+                company=record["company"],
+                alert_type=_ALERT_TYPES[record["alert_type"]],
+                severity=_SEVERITIES[record["severity"]],
+                message=record["message"],
+                details=record["details"],
+                generated_at=record["generated_at"],
+                truth_card_url=record.get("truth_card_url"),
+                acknowledged=record.get("acknowledged", False),
+                acknowledged_at=datetime.fromisoformat(record["acknowledged_at"])
+                if record.get("acknowledged_at")
+                else None,
+            )
+            for record in latest
+        ]
 
     def acknowledge_alert(self, company: str, alert_id: str) -> bool:
         """
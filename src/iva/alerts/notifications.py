@@ -4,16 +4,37 @@ Alert notification system.
 Handles sending alerts via various channels (Slack, email, etc.).
 """
 
+import asyncio
+import logging
 from typing import List
 
 from ..alerts.monitor import Alert
 from ..notify.slack import post_slack_alert
 
+logger = logging.getLogger(__name__)
+
+
+async def _dispatch(channel: str, alert: Alert) -> None:
+    """Deliver an alert to a single channel, logging (not raising) on failure."""
+    if channel == "slack":
+        try:
+            await post_slack_alert(alert)
+        except Exception as e:
+            logger.error("Error sending Slack alert: %s", e)
+    elif channel == "email":
+        # Email notification would be implemented here
+        logger.info("Email notifications not yet implemented")
+    else:
+        logger.warning("Unknown channel: %s", channel)
+
 
 async def send_alert(alert: Alert, channels: List[str] = None) -> None:
     """
     Send an alert via specified channels.
 
+    Channels are dispatched concurrently, so latency is bounded by the slowest channel
+    rather than the sum of all of them.
+
     Args:
         alert: The alert to send
         channels: List of channel names (e.g., ["slack", "email"])
@@ -21,14 +42,9 @@ async def send_alert(alert: Alert, channels: List[str] = None) -> None:
     if channels is None:
         channels = ["slack"]  # Default to Slack
 
-    for channel in channels:
-        if channel == "slack":
-            try:
-                await post_slack_alert(alert)
-            except Exception as e:
-                print(f"[ALERTS] Error sending Slack alert: {e}")
-        elif channel == "email":
-            # Email notification would be implemented here
-            print(f"[ALERTS] Email notifications not yet implemented")
-        else:
-            print(f"[ALERTS] Unknown channel: {channel}")
+    results = await asyncio.gather(
+        *(_dispatch(channel, alert) for channel in channels), return_exceptions=True
+    )
+    for channel, result in zip(channels, results, strict=True):
+        if isinstance(result, BaseException):
+            logger.error("Error dispatching alert to %s: %s", channel, result)
@@ -1,12 +1,33 @@
 import asyncio
+import hashlib
+import logging
 import uuid
 from datetime import UTC, datetime
+from pathlib import Path
+from string import Template
 from typing import Optional
 
 import typer
 
-from .adapters import bank_partners, cfpb, edgar_filings, fintrac, news, nmls, press_metrics, trust_center
-from .ingestion.fetch import fetch_html, fetch_rendered
+from .adapters import (
+    analyst_coverage,
+    bank_partners,
+    cfpb,
+    earnings_calls,
+    edgar_filings,
+    fintrac,
+    historical_tracking,
+    news,
+    nmls,
+    peer_comparison,
+    press_metrics,
+    press_releases,
+    trust_center,
+)
+from .alerts.monitor import AlertManager
+from .alerts.notifications import send_alert
+from .config import settings
+from .ingestion.fetch import aclose_browser, aclose_client, fetch_html, fetch_rendered
 from .ingestion.parse import html_to_text
 from .learning.feedback import (
     AnalystAction,
@@ -15,12 +36,23 @@ from .learning.feedback import (
     sync_feedback,
 )
 from .llm.client import json_call
+from .logging import setup_logging
 from .models.claims import ClaimSet, ExtractedClaim
 from .notify.memo import render_html
 from .notify.slack import post_slack
 from .reconcile.engine import reconcile
 
 app = typer.Typer()
+logger = logging.getLogger(__name__)
+
+# Loaded once at import rather than re-read from disk on every verification. Per-request
+# values only ever follow the static template so the LLM prompt-cache prefix stays stable.
+_PROMPT_TEMPLATE = (Path(__file__).parent / "llm" / "prompts" / "extract_claims.prompt").read_text()
+# Page text beyond this is never sent to the LLM, so parsing stops there
+_MAX_PROMPT_CHARS = 12000
+_PROMPT_INPUT = Template(
+    "\n\nURL: $url\nCompany: $company\nJurisdiction: $jurisdiction\n\nCONTENT:\n$content"
+)
 
 CLAIMS_SCHEMA = {
     "type": "object",
@@ -65,6 +97,12 @@ CLAIMS_SCHEMA = {
 }
 
 
+@app.callback()
+def main() -> None:
+    """Iva Truth Meter command-line interface."""
+    setup_logging(settings.log_level)
+
+
 @app.command()
 def verify(
     url: str,
@@ -76,7 +114,9 @@ def verify(
     render_js: bool = False,
 ):
     """Verify claims on a company website against authoritative sources."""
-    asyncio.run(_verify(url, company, jurisdiction, render_js, emit_slack=True, ticker=ticker))
+    asyncio.run(
+        _verify_once(url, company, jurisdiction, render_js, emit_slack=True, ticker=ticker)
+    )
 
 
 @app.command("feedback")
@@ -109,13 +149,30 @@ def log_feedback(
         notes=notes or None,
         updated_verdict=updated_verdict,
     )
-    FeedbackLogger().log(entry)
+    with FeedbackLogger() as feedback_log:
+        feedback_log.log(entry)
     adjustments = sync_feedback()
     typer.echo(
         f"Feedback logged. Current adjustments for {discrepancy_type}: {adjustments.get(discrepancy_type, {})}"
     )
 
 
+async def _verify_once(*args, **kwargs):
+    """Run a single verification, then release shared network resources."""
+    try:
+        return await _verify(*args, **kwargs)
+    finally:
+        await aclose_client()
+        await aclose_browser()
+
+
+def _claim_key(c: dict) -> bytes:
+    """Hashable dedup key: category plus casefolded claim text and kind."""
+    text = c["claim_text"].strip().casefold()
+    kind = (c.get("claim_kind") or "").strip().casefold()
+    return hashlib.blake2b(f"{c['category']}|{text}|{kind}".encode(), digest_size=16).digest()
+
+
 async def _verify(
     url: str,
     company: str,
@@ -125,44 +182,39 @@ async def _verify(
     ticker: Optional[str] = None,
 ):
     html = await (fetch_rendered(url) if render_js else fetch_html(url))
-    text = html_to_text(html)
-    print(f"\n[DEBUG] Extracted {len(text)} chars from {url}")
-
-    with open("src/iva/llm/prompts/extract_claims.prompt") as f:
-        prompt_template = f.read()
-    prompt = (
-        prompt_template
-        + f"\n\nURL: {url}\nCompany: {company}\nJurisdiction: {jurisdiction}\n\nCONTENT:\n{text[:12000]}"
+    text = html_to_text(html, max_chars=_MAX_PROMPT_CHARS)
+    logger.debug("Extracted %d chars from %s", len(text), url)
+
+    prompt = _PROMPT_TEMPLATE + _PROMPT_INPUT.substitute(
+        url=url, company=company, jurisdiction=jurisdiction, content=text
     )
-    print(f"[DEBUG] Sending {len(prompt)} chars to LLM for claim extraction...")
+    logger.debug("Sending %d chars to LLM for claim extraction", len(prompt))
 
     raw = json_call(prompt, CLAIMS_SCHEMA)
-    print(f"[DEBUG] LLM extracted {len(raw.get('claims', []))} claims")
+    logger.debug("LLM extracted %d claims", len(raw.get("claims", [])))
 
+    # model_construct skips field validation when the deployment trusts the LLM schema
+    make_claim = ExtractedClaim.model_construct if settings.trust_llm_schema else ExtractedClaim
     claims = []
     seen_claims = set()  # Track claim fingerprints to deduplicate
     
     for c in raw.get("claims", []):
         # Required fields per schema - but handle gracefully if LLM returns malformed data
         if "category" not in c or "claim_text" not in c:
-            print(f"[WARN] Skipping malformed claim: {c}")
+            logger.warning("Skipping malformed claim: %s", c)
             continue
         
-        # Deduplication: Create fingerprint from normalized claim text
-        claim_fingerprint = (
-            c["category"],
-            c["claim_text"].lower().strip(),
-            c.get("claim_kind", "").lower().strip(),
-        )
-        
+        # Deduplication: one fixed-size digest of the normalized claim per entry
+        claim_fingerprint = _claim_key(c)
+
         if claim_fingerprint in seen_claims:
-            print(f"[DEDUP] Skipping duplicate claim: {c['claim_text'][:60]}...")
+            logger.debug("Skipping duplicate claim: %.60s", c["claim_text"])
             continue
-        
+
         seen_claims.add(claim_fingerprint)
         
         claims.append(
-            ExtractedClaim(
+            make_claim(
                 id=c.get("id") or str(uuid.uuid4()),
                 category=c["category"],
                 claim_text=c["claim_text"],
@@ -175,77 +227,74 @@ async def _verify(
             )
         )
     
-    print(f"[DEBUG] After deduplication: {len(claims)} unique claims")
-    claimset = ClaimSet(url=url, company=company, extracted_at=datetime.now(UTC), claims=claims)
+    logger.debug("After deduplication: %d unique claims", len(claims))
+    make_claimset = ClaimSet.model_construct if settings.trust_llm_schema else ClaimSet
+    claimset = make_claimset(
+        url=url, company=company, extracted_at=datetime.now(UTC), claims=claims
+    )
 
-    print(f"\n[DEBUG] Created ClaimSet with {len(claims)} claims:")
-    for i, cl in enumerate(claims[:5], 1):
-        print(f"  {i}. [{cl.category}] {cl.claim_text[:80]}...")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Created ClaimSet with %d claims", len(claims))
+        for i, cl in enumerate(claims[:5], 1):
+            logger.debug("  %d. [%s] %.80s", i, cl.category, cl.claim_text)
 
     # Adapters
-    print(f"\n[DEBUG] Running verification adapters...")
-
-    # Import Phase 3 adapters
-    # Import Phase 4 adapters
-    from .adapters import (
-        analyst_coverage,
-        earnings_calls,
-        historical_tracking,
-        peer_comparison,
-        press_releases,
-    )
+    logger.debug("Running verification adapters")
 
+    # All adapters are independent network I/O, so run them concurrently
+    adapter_calls = {
+        "nmls": nmls.check_nmls(company),
+        "fintrac": fintrac.check_fintrac(company),
+        # Use real EDGAR adapter for all companies (attempts name lookup if no ticker)
+        "edgar_filings": edgar_filings.check_edgar_filings(company, ticker=ticker),
+        "cfpb": cfpb.check_cfpb(company),
+        "bank_partners": bank_partners.check_bank_partners(company),
+        "trust_center": trust_center.check_trust_center(url),
+        "news": news.search_press(company),
+        "press_metrics": press_metrics.check_press_metrics(company),
+        # Always run historical tracking (works for all companies)
+        "historical_tracking": historical_tracking.get_claim_history_summary(company),
+    }
     # Run Phase 3 adapters (only for public companies with ticker)
-    phase3_adapters = {}
     if ticker:
-        phase3_adapters = {
-            "earnings_calls": await earnings_calls.check_earnings_calls(company, ticker=ticker),
-            "press_releases": await press_releases.check_press_releases(company, ticker=ticker),
-            "analyst_coverage": await analyst_coverage.check_analyst_coverage(
-                company, ticker=ticker
-            ),
-            "peer_comparison": await peer_comparison.check_peer_comparison(company, ticker=ticker),
-        }
+        adapter_calls.update(
+            {
+                "earnings_calls": earnings_calls.check_earnings_calls(company, ticker=ticker),
+                "press_releases": press_releases.check_press_releases(company, ticker=ticker),
+                "analyst_coverage": analyst_coverage.check_analyst_coverage(
+                    company, ticker=ticker
+                ),
+                "peer_comparison": peer_comparison.check_peer_comparison(company, ticker=ticker),
+            }
+        )
 
-    # Always run historical tracking (works for all companies)
-    historical_findings = await historical_tracking.get_claim_history_summary(company)
-    phase3_adapters["historical_tracking"] = historical_findings
+    results = await asyncio.gather(*adapter_calls.values(), return_exceptions=True)
+    adapters = {}
+    for adapter_name, result in zip(adapter_calls, results, strict=True):
+        if isinstance(result, BaseException):
+            logger.warning("Adapter %s failed: %s", adapter_name, result)
+            result = []
+        adapters[adapter_name] = result
+    # Map to both keys for compatibility during migration
+    adapters["edgar"] = adapters["edgar_filings"]
 
-    # Save current claim set for historical tracking
+    # Save current claim set for historical tracking (after the summary read prior state)
     historical_tracking.save_claim_set(claimset)
 
-    # Use real EDGAR adapter for all companies (attempts name lookup if no ticker)
-    edgar_results = await edgar_filings.check_edgar_filings(company, ticker=ticker)
-
-    adapters = {
-        "nmls": await nmls.check_nmls(company),
-        "fintrac": await fintrac.check_fintrac(company),
-        "edgar": edgar_results,  # Map to both keys for compatibility during migration
-        "edgar_filings": edgar_results,
-        "cfpb": await cfpb.check_cfpb(company),
-        "bank_partners": await bank_partners.check_bank_partners(company),
-        "trust_center": await trust_center.check_trust_center(url),
-        "news": await news.search_press(company),
-        "press_metrics": await press_metrics.check_press_metrics(company),
-        **phase3_adapters,  # Merge Phase 3 adapters
-    }
-
-    for adapter_name, results in adapters.items():
-        print(f"  - {adapter_name}: {len(results)} findings")
+    if logger.isEnabledFor(logging.DEBUG):
+        for adapter_name, results in adapters.items():
+            logger.debug("  - %s: %d findings", adapter_name, len(results))
 
-    print(f"\n[DEBUG] Reconciling claims against adapter findings...")
+    logger.debug("Reconciling claims against adapter findings")
     card = reconcile(claimset, adapters)
-    print(f"[DEBUG] Found {len(card.discrepancies)} discrepancies")
+    logger.debug("Found %d discrepancies", len(card.discrepancies))
 
     # Phase 4: Generate alerts for material changes
-    from .alerts.monitor import AlertManager
-    from .alerts.notifications import send_alert
-
     alert_manager = AlertManager()
     alerts = alert_manager.process_truth_card(card)
 
     if alerts:
-        print(f"[DEBUG] Generated {len(alerts)} alerts")
+        logger.debug("Generated %d alerts", len(alerts))
         # Send critical/high severity alerts
         for alert in alerts:
             if alert.severity.value in ["critical", "high"]:
@@ -31,6 +31,10 @@ class Settings(BaseModel):
 
     user_agent: str = os.getenv("USER_AGENT", "IvaTruthMeter/0.1")
     request_timeout: int = int(os.getenv("REQUEST_TIMEOUT", "20"))
+    log_level: str = os.getenv("LOG_LEVEL", "INFO").upper()
+    llm_cache: bool = os.getenv("IVA_LLM_CACHE", "on").lower() != "off"
+    # Skip Pydantic validation of LLM-extracted claims (trusts the JSON schema instead)
+    trust_llm_schema: bool = os.getenv("IVA_TRUST_LLM_SCHEMA", "false").lower() == "true"
 
 
 settings = Settings()
@@ -1,7 +1,10 @@
+import re
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Iterable
 
+import orjson
+
 from ..models.recon import Discrepancy, TruthCard
 
 try:
@@ -10,8 +13,11 @@ except ImportError:  # pragma: no cover - Playwright optional
     sync_playwright = None  # type: ignore
 
 
+_NON_ALNUM = re.compile(r"[\W_]")
+
+
 def _slugify(value: str) -> str:
-    return "".join([c.lower() if c.isalnum() else "-" for c in value]).strip("-") or "card"
+    return _NON_ALNUM.sub("-", value.lower()).strip("-") or "card"
 
 
 def _discrepancy_summary(discrepancies: Iterable[Discrepancy]) -> list[str]:
@@ -25,6 +31,49 @@ def _discrepancy_summary(discrepancies: Iterable[Discrepancy]) -> list[str]:
     return lines
 
 
+_HUNK_HEADER = re.compile(r"^@@ -(\d+)(,\d+)? \+(\d+)(,\d+)? @@$")
+
+
+def _dom_diff(previous: str, current: str, context: int = 3) -> str:
+    """Unified diff of two DOM snapshots.
+
+    Snapshots usually differ in a small region, so the identical head and tail are
+    trimmed before handing the remaining window to difflib; hunk headers are then
+    shifted back to absolute line numbers.
+    """
+    import difflib
+
+    old, new = previous.splitlines(), current.splitlines()
+    limit = min(len(old), len(new))
+    head = 0
+    while head < limit and old[head] == new[head]:
+        head += 1
+    tail = 0
+    while tail < limit - head and old[-1 - tail] == new[-1 - tail]:
+        tail += 1
+    lo = max(head - context, 0)
+    trim = max(tail - context, 0)
+
+    def shift(line: str) -> str:
+        m = _HUNK_HEADER.match(line)
+        if not m:
+            return line
+        a, b = int(m.group(1)) + lo, int(m.group(3)) + lo
+        return f"@@ -{a}{m.group(2) or ''} +{b}{m.group(4) or ''} @@"
+
+    return "\n".join(
+        shift(line)
+        for line in difflib.unified_diff(
+            old[lo : len(old) - trim],
+            new[lo : len(new) - trim],
+            fromfile="previous",
+            tofile="current",
+            lineterm="",
+            n=context,
+        )
+    )
+
+
 def _capture_with_playwright(url: str, annotations: list[str], artifact_dir: Path) -> None:
     if not sync_playwright:
         return
@@ -62,18 +111,9 @@ def _capture_with_playwright(url: str, annotations: list[str], artifact_dir: Pat
     if dom_path.exists():
         previous = dom_path.read_text()
         if previous != dom_html:
-            import difflib
-
-            diff = "\n".join(
-                difflib.unified_diff(
-                    previous.splitlines(),
-                    dom_html.splitlines(),
-                    fromfile="previous",
-                    tofile="current",
-                    lineterm="",
-                )
+            diff_path.write_text(
+                _dom_diff(previous, dom_html) or "No diff content", encoding="utf-8"
             )
-            diff_path.write_text(diff or "No diff content", encoding="utf-8")
     dom_path.write_text(dom_html, encoding="utf-8")
 
 
@@ -84,8 +124,10 @@ def generate_truthcard_artifacts(card: TruthCard, artifact_root: Path | None = N
     folder = root / f"{stamp}-{_slugify(card.company)}"
     folder.mkdir(parents=True, exist_ok=True)
 
-    (folder / "truth_card.json").write_text(card.model_dump_json(indent=2), encoding="utf-8")
+    (folder / "truth_card.json").write_bytes(
+        orjson.dumps(card.model_dump(mode="json"), option=orjson.OPT_INDENT_2)
+    )
     annotations = _discrepancy_summary(card.discrepancies)
-    (folder / "summary.txt").write_text("\n".join(annotations), encoding="utf-8")
+    (folder / "summary.txt").write_bytes("\n".join(annotations).encode("utf-8"))
     _capture_with_playwright(card.url, annotations, folder)
     return folder
@@ -1,12 +1,16 @@
-import json
 import pathlib
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from enum import Enum
+from functools import lru_cache
 from typing import Any, Sequence
 
+import orjson
+
 from ..models.recon import TruthCard
 
+GOLDEN_PATH = pathlib.Path("src/iva/eval/datasets/golden.jsonl")
+
 
 class EvaluationTier(str, Enum):
     UNIT = "unit"
@@ -30,9 +34,42 @@ class EvaluationReport:
         }
 
 
-def load_golden():
-    p = pathlib.Path("src/iva/eval/datasets/golden.jsonl")
-    return [json.loads(line) for line in p.read_text().splitlines() if line.strip()]
+@lru_cache(maxsize=1)
+def load_golden() -> tuple[dict, ...]:
+    """Stream-parse the golden dataset once per process; the cached result is shared."""
+    with GOLDEN_PATH.open("rb") as fh:
+        return tuple(orjson.loads(line) for line in fh if line.strip())
+
+
+# url -> (expected_truth, expected_discrepancies, {type: expected_discrepancy})
+GoldenIndex = dict[str, tuple[dict, list[dict], dict[str, dict]]]
+
+_golden_index: tuple[tuple[dict, ...], GoldenIndex] | None = None
+
+
+def _index_golden(golden: Sequence[dict]) -> GoldenIndex:
+    """
+    Index the golden set by URL.
+
+    Only an immutable tuple (such as the one `load_golden` returns) has its index reused
+    across evaluations; any other sequence is re-indexed on every call.
+    """
+    global _golden_index
+    cacheable = isinstance(golden, tuple)
+    if cacheable and _golden_index is not None and _golden_index[0] is golden:
+        return _golden_index[1]
+    indexed = {}
+    for entry in golden:
+        expected_truth = entry.get("expected_truth_card", {})
+        expected_discrepancies = expected_truth.get("expected_discrepancies", [])
+        indexed[entry["url"]] = (
+            expected_truth,
+            expected_discrepancies,
+            {d["type"]: d for d in expected_discrepancies},
+        )
+    if cacheable:
+        _golden_index = (golden, indexed)
+    return indexed
 
 
 def _ensure_truth_card(card: TruthCard | dict) -> TruthCard:
@@ -62,39 +99,36 @@ def evaluate(
     failures: list[str] = []
     drift_alerts: list[str] = []
 
-    golden_by_url = {g["url"]: g for g in golden}
+    golden_index = _index_golden(golden)
     expected_total = 0
     matched_expected = 0
     bundle_checks = 0
     bundle_complete = 0
     unexpected_high = 0
+    checks_severity = target_tier in (EvaluationTier.INTEGRATION, EvaluationTier.REGRESSION)
+    is_regression = target_tier is EvaluationTier.REGRESSION
 
     for raw_card in pred_cards:
         card = _ensure_truth_card(raw_card)
-        expected_entry = golden_by_url.get(card.url)
-        if not expected_entry:
+        indexed = golden_index.get(card.url)
+        if not indexed:
             failures.append(f"{card.url} missing from golden dataset")
             continue
 
-        expected_truth = expected_entry.get("expected_truth_card", {})
-        expected_discrepancies = expected_truth.get("expected_discrepancies", [])
-        expected_index = {d["type"]: d for d in expected_discrepancies}
+        expected_truth, expected_discrepancies, expected_index = indexed
         expected_total += len(expected_discrepancies)
-        predicted_map = {d.type: d for d in card.discrepancies}
-
-        if target_tier in (
-            EvaluationTier.UNIT,
-            EvaluationTier.INTEGRATION,
-            EvaluationTier.REGRESSION,
-        ):
-            for discrepancy in card.discrepancies:
-                bundle_checks += 1
-                if discrepancy.explanation.supporting_evidence and discrepancy.provenance:
-                    bundle_complete += 1
-                else:
-                    failures.append(
-                        f"{card.url}::{discrepancy.type} missing structured bundle fields"
-                    )
+        predicted_map = {}
+
+        # Every tier checks bundle completeness; count unexpected highs in the same pass
+        for discrepancy in card.discrepancies:
+            predicted_map[discrepancy.type] = discrepancy
+            bundle_checks += 1
+            if discrepancy.explanation.supporting_evidence and discrepancy.provenance:
+                bundle_complete += 1
+            else:
+                failures.append(f"{card.url}::{discrepancy.type} missing structured bundle fields")
+            if discrepancy.severity == "high" and discrepancy.type not in expected_index:
+                unexpected_high += 1
 
         for expected_disc in expected_discrepancies:
             dtype = expected_disc["type"]
@@ -103,25 +137,20 @@ def evaluate(
                 failures.append(f"{card.url} missing expected discrepancy {dtype}")
                 continue
             matched_expected += 1
-            if target_tier in (EvaluationTier.INTEGRATION, EvaluationTier.REGRESSION):
+            if checks_severity:
                 expected_sev = expected_disc.get("severity")
                 if expected_sev and predicted.severity != expected_sev:
                     failures.append(
                         f"{card.url}::{dtype} severity {predicted.severity} != expected {expected_sev}"
                     )
-            if target_tier is EvaluationTier.REGRESSION:
+            if is_regression:
                 expected_verdict = expected_disc.get("verdict")
                 if expected_verdict and predicted.explanation.verdict != expected_verdict:
                     failures.append(
                         f"{card.url}::{dtype} verdict {predicted.explanation.verdict} != expected {expected_verdict}"
                     )
 
-        expected_types = set(expected_index.keys())
-        for discrepancy in card.discrepancies:
-            if discrepancy.severity == "high" and discrepancy.type not in expected_types:
-                unexpected_high += 1
-
-        if target_tier is EvaluationTier.REGRESSION:
+        if is_regression:
             expected_conf_range = expected_truth.get("confidence_range")
             if expected_conf_range and len(expected_conf_range) == 2:
                 low, high = expected_conf_range
@@ -1,23 +1,116 @@
+import asyncio
+
 import httpx
-from playwright.async_api import async_playwright
 
 from ..config import settings
 
+# Upper bound on concurrently open browser contexts (each holds a renderer process)
+MAX_RENDER_CONTEXTS = 4
+# Static assets that never contribute text; skipping them shortens time to DOM ready
+_BLOCKED_ASSETS = "**/*.{png,jpg,jpeg,gif,svg,woff,woff2}"
+
+# Settings are read once at import; fetches reuse these plain module values
+_TIMEOUT = settings.request_timeout
+_USER_AGENT = settings.user_agent
+_HEADERS = {"User-Agent": _USER_AGENT}
+
+_client: httpx.AsyncClient | None = None
+_client_loop: asyncio.AbstractEventLoop | None = None
+
+_playwright = None
+_browser = None
+_browser_loop: asyncio.AbstractEventLoop | None = None
+_browser_lock: asyncio.Lock | None = None
+_render_slots: asyncio.Semaphore | None = None
+
+
+async def get_client() -> httpx.AsyncClient:
+    """
+    Return the shared HTTP/2 client, creating it lazily.
+
+    Connections (DNS, TCP, TLS) are pooled across fetches. A client is bound to the event
+    loop that created it, so a new one is built if called from a different loop.
+    """
+    global _client, _client_loop
+    loop = asyncio.get_running_loop()
+    if _client is None or _client.is_closed or _client_loop is not loop:
+        _client = httpx.AsyncClient(
+            http2=True,
+            timeout=_TIMEOUT,
+            headers=_HEADERS,
+            limits=httpx.Limits(max_keepalive_connections=50, max_connections=100),
+            follow_redirects=True,
+        )
+        _client_loop = loop
+    return _client
+
+
+async def aclose_client() -> None:
+    """Close the shared HTTP client; call on application or CLI shutdown."""
+    global _client, _client_loop
+    if _client is not None:
+        await _client.aclose()
+    _client = None
+    _client_loop = None
+
 
 async def fetch_html(url: str) -> str:
-    async with httpx.AsyncClient(
-        timeout=settings.request_timeout, headers={"User-Agent": settings.user_agent}
-    ) as client:
-        r = await client.get(url, follow_redirects=True)
-        r.raise_for_status()
-        return r.text
-
-
-async def fetch_rendered(url: str) -> str:
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True)
-        page = await browser.new_page(user_agent=settings.user_agent)
-        await page.goto(url, wait_until="networkidle")
-        content = await page.content()
-        await browser.close()
-        return content
+    client = await get_client()
+    r = await client.get(url)
+    r.raise_for_status()
+    return r.text
+
+
+async def _get_browser():
+    """Return a warm headless Chromium, launching it once per event loop."""
+    global _playwright, _browser, _browser_loop, _browser_lock, _render_slots
+    loop = asyncio.get_running_loop()
+    if _browser_loop is not loop:
+        _playwright = _browser = None
+        _browser_loop = loop
+        _browser_lock = asyncio.Lock()
+        _render_slots = asyncio.Semaphore(MAX_RENDER_CONTEXTS)
+    async with _browser_lock:
+        if _browser is None or not _browser.is_connected():
+            if _playwright is None:
+                # Imported here so plain HTTP fetches never pay for loading Playwright
+                from playwright.async_api import async_playwright
+
+                _playwright = await async_playwright().start()
+            _browser = await _playwright.chromium.launch(headless=True)
+    return _browser
+
+
+async def aclose_browser() -> None:
+    """Close the shared browser and stop Playwright; call on application or CLI shutdown."""
+    global _playwright, _browser, _browser_loop
+    if _browser is not None:
+        await _browser.close()
+    if _playwright is not None:
+        await _playwright.stop()
+    _playwright = _browser = _browser_loop = None
+
+
+async def _abort_route(route) -> None:
+    await route.abort()
+
+
+async def fetch_rendered(url: str, wait_selector: str | None = None) -> str:
+    """
+    Render a page in the shared browser and return its HTML.
+
+    Returns once the DOM is parsed rather than waiting for network idle; pass
+    `wait_selector` when the content of interest is injected later by scripts.
+    """
+    browser = await _get_browser()
+    async with _render_slots:
+        context = await browser.new_context(user_agent=_USER_AGENT)
+        try:
+            await context.route(_BLOCKED_ASSETS, _abort_route)
+            page = await context.new_page()
+            await page.goto(url, wait_until="domcontentloaded", timeout=30_000)
+            if wait_selector:
+                await page.wait_for_selector(wait_selector, timeout=10_000)
+            return await page.content()
+        finally:
+            await context.close()
@@ -1,22 +1,70 @@
-from io import BytesIO
+import asyncio
+import re
+import threading
 
-import httpx
+import pypdfium2 as pdfium
 from bs4 import BeautifulSoup
-from pypdf import PdfReader
+from selectolax.lexbor import LexborHTMLParser
 
+from .fetch import get_client
 
-def html_to_text(html: str) -> str:
+_WORD = re.compile(r"\S+")
+
+
+def _collapse_whitespace(text: str, max_chars: int | None) -> str:
+    if max_chars is None:
+        return " ".join(text.split())
+    # Stop scanning once the limit is reached rather than normalising the whole page
+    words: list[str] = []
+    size = 0
+    for m in _WORD.finditer(text):
+        words.append(m.group())
+        size += len(words[-1]) + 1
+        if size > max_chars:
+            break
+    return " ".join(words)[:max_chars]
+
+
+def html_to_text(html: str, max_chars: int | None = None) -> str:
+    try:
+        tree = LexborHTMLParser(html)
+    except Exception:
+        return _html_to_text_bs4(html, max_chars)
+    tree.strip_tags(["script", "style", "noscript"])
+    text = tree.root.text(separator=" ", strip=True) if tree.root else ""
+    return _collapse_whitespace(text, max_chars)
+
+
+def _html_to_text_bs4(html: str, max_chars: int | None = None) -> str:
     soup = BeautifulSoup(html, "html.parser")
     for tag in soup(["script", "style", "noscript"]):
         tag.decompose()
-    text = " ".join(soup.get_text(" ", strip=True).split())
-    return text
+    return _collapse_whitespace(soup.get_text(" ", strip=True), max_chars)
+
+
+# PDFium is not thread-safe, even across different documents, so worker threads take turns
+_PDFIUM_LOCK = threading.Lock()
+
+
+def _pdf_to_text(data: bytes) -> str:
+    with _PDFIUM_LOCK:
+        pdf = pdfium.PdfDocument(data)
+        try:
+            pages = []
+            for page in pdf:
+                textpage = page.get_textpage()
+                pages.append(textpage.get_text_bounded())
+                textpage.close()
+                page.close()
+            return "\n".join(pages)
+        finally:
+            pdf.close()
 
 
 async def fetch_pdf_text(url: str) -> str:
-    async with httpx.AsyncClient() as client:
-        r = await client.get(url)
+    client = await get_client()
+    async with client.stream("GET", url) as r:
         r.raise_for_status()
-        pdf = PdfReader(BytesIO(r.content))
-        pages = [p.extract_text() or "" for p in pdf.pages]
-        return "\n".join(pages)
+        data = await r.aread()
+    # PDFium extraction is CPU-bound; keep it off the event loop
+    return await asyncio.to_thread(_pdf_to_text, data)
@@ -1,16 +1,19 @@
-import json
-from collections import defaultdict
+import io
+from collections import Counter, defaultdict, deque
 from datetime import UTC, datetime
 from enum import Enum
 from pathlib import Path
-from typing import Iterable
+from typing import BinaryIO, Iterable, Iterator
 
-from pydantic import BaseModel, Field
+import orjson
+from pydantic import BaseModel, Field, TypeAdapter
 
 FEEDBACK_DIR = Path("data/feedback")
 EVENTS_PATH = FEEDBACK_DIR / "events.jsonl"
 ADJUSTMENTS_PATH = FEEDBACK_DIR / "rule_adjustments.json"
 PROMPT_NOTES_PATH = FEEDBACK_DIR / "prompt_overrides.md"
+# Number of most recent events summarised into the prompt overrides
+PROMPT_OVERRIDE_WINDOW = 20
 
 
 class AnalystAction(str, Enum):
@@ -32,40 +35,93 @@ class FeedbackEntry(BaseModel):
     timestamp: datetime = Field(default_factory=lambda: datetime.now(UTC))
 
 
+_ENTRY_LIST = TypeAdapter(list[FeedbackEntry])
+
+
 class FeedbackLogger:
+    """Appends feedback events to the JSONL log through one long-lived file handle."""
+
     def __init__(self, events_path: Path = EVENTS_PATH):
+        # Set before anything that can raise so __del__ -> close() always finds it
+        self._fh: BinaryIO | None = None
         self.events_path = events_path
         FEEDBACK_DIR.mkdir(parents=True, exist_ok=True)
 
     def log(self, entry: FeedbackEntry) -> None:
-        with self.events_path.open("a", encoding="utf-8") as fh:
-            fh.write(entry.model_dump_json() + "\n")
+        if self._fh is None:
+            # Unbuffered append: each event reaches the file in a single write() call
+            self._fh = self.events_path.open("ab", buffering=0)
+        self._fh.write(entry.model_dump_json().encode() + b"\n")
+
+    def close(self) -> None:
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+
+    def __enter__(self) -> "FeedbackLogger":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __del__(self) -> None:
+        self.close()
+
 
+def load_feedback(events_path: Path = EVENTS_PATH, strict: bool = False) -> list[FeedbackEntry]:
+    """
+    Load logged feedback events.
 
-def load_feedback(events_path: Path = EVENTS_PATH) -> list[FeedbackEntry]:
+    The log is written by FeedbackLogger, so rows are trusted and built with model_construct
+    by default; pass strict=True to run full Pydantic validation on every row.
+    """
     if not events_path.exists():
         return []
-    entries: list[FeedbackEntry] = []
-    with events_path.open("r", encoding="utf-8") as fh:
+    # Binary mode hands raw bytes to the JSON parser; trailing newlines are ignored
+    with events_path.open("rb") as fh:
+        if strict:
+            # Validate the whole log as one JSON array in a single parser pass
+            rows = [line for line in fh if not line.isspace()]
+            return _ENTRY_LIST.validate_json(b"[" + b",".join(rows) + b"]")
+        return [_construct_entry(orjson.loads(line)) for line in fh if not line.isspace()]
+
+
+def _construct_entry(data: dict) -> FeedbackEntry:
+    data["analyst_action"] = AnalystAction(data["analyst_action"])
+    data["timestamp"] = datetime.fromisoformat(data["timestamp"])
+    return FeedbackEntry.model_construct(**data)
+
+
+def iter_feedback(events_path: Path = EVENTS_PATH) -> Iterator[tuple[str, str, bytes]]:
+    """Yield (discrepancy_type, action, raw_line) per event without full model validation."""
+    if not events_path.exists():
+        return
+    with events_path.open("rb") as fh:
         for line in fh:
-            line = line.strip()
-            if not line:
+            if line.isspace():
                 continue
-            entries.append(FeedbackEntry.model_validate_json(line))
-    return entries
+            event = orjson.loads(line)
+            yield event["discrepancy_type"], event["analyst_action"], line
 
 
 def compute_rule_adjustments(entries: Iterable[FeedbackEntry]) -> dict[str, dict[str, float]]:
-    tally: dict[str, dict[str, int]] = defaultdict(lambda: defaultdict(int))
-    for entry in entries:
-        tally[entry.discrepancy_type][entry.analyst_action.value] += 1
+    counts = Counter((entry.discrepancy_type, entry.analyst_action.value) for entry in entries)
+    return _adjustments_from_counts(counts)
+
+
+def _adjustments_from_counts(counts: Counter[tuple[str, str]]) -> dict[str, dict[str, float]]:
+    """Derive per-type adjustments from (discrepancy_type, action) counts."""
+    totals: Counter[str] = Counter()
+    for (discrepancy_type, _), n in counts.items():
+        totals[discrepancy_type] += n
     adjustments: dict[str, dict[str, float]] = {}
-    for discrepancy_type, counts in tally.items():
-        total = sum(counts.values())
+    for discrepancy_type, total in totals.items():
         if not total:
             continue
-        confirm_bias = (counts.get("confirm", 0) - counts.get("dismiss", 0)) / total
-        override_bias = counts.get("override", 0) / total
+        confirm = counts[discrepancy_type, "confirm"]
+        dismiss = counts[discrepancy_type, "dismiss"]
+        confirm_bias = (confirm - dismiss) / total
+        override_bias = counts[discrepancy_type, "override"] / total
         adjustments[discrepancy_type] = {
             "threshold_shift": round(confirm_bias * 0.1, 4),
             "confidence_shift": round(override_bias * -0.05, 4),
@@ -75,48 +131,57 @@ def compute_rule_adjustments(entries: Iterable[FeedbackEntry]) -> dict[str, dict
 
 
 def write_rule_adjustments(
-    adjustments: dict[str, dict[str, float]], path: Path = ADJUSTMENTS_PATH
+    adjustments: dict[str, dict[str, float]],
+    path: Path = ADJUSTMENTS_PATH,
+    now: datetime | None = None,
 ) -> None:
     FEEDBACK_DIR.mkdir(parents=True, exist_ok=True)
     payload = {
-        "updated_at": datetime.now(UTC).isoformat(),
+        "updated_at": now or datetime.now(UTC),
         "adjustments": adjustments,
     }
-    path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    path.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
 
 
 def write_prompt_overrides(
-    entries: Iterable[FeedbackEntry], path: Path = PROMPT_NOTES_PATH
+    entries: Iterable[FeedbackEntry],
+    path: Path = PROMPT_NOTES_PATH,
+    now: datetime | None = None,
 ) -> None:
     FEEDBACK_DIR.mkdir(parents=True, exist_ok=True)
     grouped: dict[str, list[str]] = defaultdict(list)
-    for entry in list(entries)[-20:]:
+    for entry in deque(entries, maxlen=PROMPT_OVERRIDE_WINDOW):
         note = f"{entry.analyst_action.value}"
         if entry.updated_verdict:
             note += f" → {entry.updated_verdict}"
         if entry.notes:
             note += f" • {entry.notes}"
         grouped[entry.discrepancy_type].append(note)
-    lines = [
-        "# Prompt Overrides",
-        "",
-        f"*Last refreshed:* {datetime.now(UTC).isoformat()}",
-        "",
-    ]
+    buf = io.StringIO()
+    write = buf.write
+    write(f"# Prompt Overrides\n\n*Last refreshed:* {(now or datetime.now(UTC)).isoformat()}\n\n")
     if not grouped:
-        lines.append("_No recent analyst overrides recorded._")
+        write("_No recent analyst overrides recorded._")
     else:
         for discrepancy_type, notes in grouped.items():
-            lines.append(f"## {discrepancy_type}")
+            write(f"## {discrepancy_type}\n")
             for note in notes:
-                lines.append(f"- {note}")
-            lines.append("")
-    path.write_text("\n".join(lines).strip() + "\n", encoding="utf-8")
+                write(f"- {note}\n")
+            write("\n")
+    path.write_text(buf.getvalue().rstrip() + "\n", encoding="utf-8")
 
 
 def sync_feedback() -> dict[str, dict[str, float]]:
-    entries = load_feedback()
-    adjustments = compute_rule_adjustments(entries)
-    write_rule_adjustments(adjustments)
-    write_prompt_overrides(entries)
+    # One streaming pass: tally the two fields every row needs, and only fully
+    # validate the rows that feed the prompt overrides
+    counts: Counter[tuple[str, str]] = Counter()
+    tail: deque[bytes] = deque(maxlen=PROMPT_OVERRIDE_WINDOW)
+    for discrepancy_type, action, line in iter_feedback():
+        counts[discrepancy_type, action] += 1
+        tail.append(line)
+    adjustments = _adjustments_from_counts(counts)
+    # Both outputs carry the same refresh time
+    now = datetime.now(UTC)
+    write_rule_adjustments(adjustments, now=now)
+    write_prompt_overrides((FeedbackEntry.model_validate_json(line) for line in tail), now=now)
     return adjustments
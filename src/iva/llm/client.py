@@ -1,13 +1,27 @@
-import json
+import asyncio
+import functools
+import hashlib
+import logging
 import os
-from typing import Any, Dict, Optional
+import re
+import tempfile
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
 
+import orjson
 from google import genai
 from google.genai import types
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception
 
+from ..config import settings
+
 MODEL_NAME = "gemini-3-flash"
 
+# Content-addressed cache of parsed json_call responses
+LLM_CACHE_DIR = Path(__file__).parent.parent.parent.parent / "data" / "cache" / "llm"
+
+logger = logging.getLogger(__name__)
+
 _client: Optional[genai.Client] = None
 
 
@@ -46,55 +60,129 @@ def is_rate_limit_error(exception: BaseException) -> bool:
     )
 
 
+def _log_usage(response: Any) -> None:
+    """Report prompt vs. implicitly cached tokens so prefix-cache hit rates are observable."""
+    usage = getattr(response, "usage_metadata", None)
+    if usage is not None:
+        logger.debug(
+            "Gemini usage: prompt_tokens=%s cached_tokens=%s",
+            usage.prompt_token_count,
+            usage.cached_content_token_count,
+        )
+
+
+def _disk_cached(fn: Callable[..., Dict[str, Any]]) -> Callable[..., Dict[str, Any]]:
+    """
+    Cache JSON responses on disk keyed by sha256 of (model, schema, prompt).
+
+    Re-verifying an unchanged page returns the stored result without an API round-trip.
+    Set IVA_LLM_CACHE=off to bypass.
+    """
+
+    @functools.wraps(fn)
+    def wrapper(prompt: str, schema: Dict[str, Any], model: str | None = None) -> Dict[str, Any]:
+        if not settings.llm_cache:
+            return fn(prompt, schema, model)
+        digest = hashlib.sha256()
+        digest.update((model or MODEL_NAME).encode())
+        digest.update(orjson.dumps(schema, option=orjson.OPT_SORT_KEYS))
+        digest.update(prompt.encode())
+        key = digest.hexdigest()
+        path = LLM_CACHE_DIR / key[:2] / f"{key}.json"
+        if path.exists():
+            try:
+                return orjson.loads(path.read_bytes())
+            except orjson.JSONDecodeError:
+                logger.warning("Ignoring corrupt LLM cache entry %s", path)
+        result = fn(prompt, schema, model)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write-then-rename so concurrent readers never see a partial entry
+        with tempfile.NamedTemporaryFile(dir=path.parent, suffix=".tmp", delete=False) as tmp:
+            tmp.write(orjson.dumps(result))
+        os.replace(tmp.name, path)
+        return result
+
+    return wrapper
+
+
+# Optional markdown code fence around the JSON body, captured without surrounding whitespace
+_FENCE = re.compile(r"\s*(?:```(?:json)?)?\s*(.*?)\s*(?:```)?\s*", re.DOTALL)
+
+# Serialized schema text per schema object; json_call schemas are module-level constants
+_SCHEMA_TEXT: Dict[int, tuple[Dict[str, Any], str]] = {}
+
+
+def _schema_text(schema: Dict[str, Any]) -> str:
+    cached = _SCHEMA_TEXT.get(id(schema))
+    if cached is None or cached[0] is not schema:
+        cached = (schema, orjson.dumps(schema, option=orjson.OPT_INDENT_2).decode())
+        _SCHEMA_TEXT[id(schema)] = cached
+    return cached[1]
+
+
+# Shared by every Gemini request; built once rather than per call
+_retry_rate_limited = retry(
+    stop=stop_after_attempt(5),
+    wait=wait_exponential(multiplier=1, min=2, max=60),
+    retry=retry_if_exception(is_rate_limit_error),
+    reraise=True,
+)
+
+_JSON_CONFIG = types.GenerateContentConfig(response_mime_type="application/json")
+
+
+@_retry_rate_limited
+def _json_request(contents: str) -> Dict[str, Any]:
+    response = _get_client().models.generate_content(
+        model=MODEL_NAME, contents=contents, config=_JSON_CONFIG
+    )
+    _log_usage(response)
+    content = response.text or "{}"
+    return orjson.loads(_FENCE.fullmatch(content).group(1))
+
+
+@_retry_rate_limited
+def _text_request(prompt: str) -> str:
+    response = _get_client().models.generate_content(model=MODEL_NAME, contents=prompt)
+    return response.text or ""
+
+
+@_disk_cached
 def json_call(prompt: str, schema: Dict[str, Any], model: str | None = None) -> Dict[str, Any]:
-    """Extract structured JSON using Gemini. Returns parsed JSON matching the schema."""
-    
-    @retry(
-        stop=stop_after_attempt(5),
-        wait=wait_exponential(multiplier=1, min=2, max=60),
-        retry=retry_if_exception(is_rate_limit_error),
-        reraise=True
+    """
+    Extract structured JSON using Gemini. Returns parsed JSON matching the schema.
+
+    The instructions and schema come first and `prompt` last, so callers that keep their
+    own static text ahead of per-request input get a byte-identical prefix that the
+    provider's implicit prompt cache can reuse.
+    """
+    return _json_request(
+        f"""You extract fintech claims. Output strict JSON conforming to this schema:
+{_schema_text(schema)}
+
+{prompt}"""
     )
-    def make_request() -> Dict[str, Any]:
-        client = _get_client()
-        response = client.models.generate_content(
-            model=MODEL_NAME,
-            contents=f"""You extract fintech claims. Output strict JSON conforming to this schema:
-{json.dumps(schema, indent=2)}
-
-{prompt}""",
-            config=types.GenerateContentConfig(
-                response_mime_type="application/json",
-            )
-        )
-        content = response.text or "{}"
-        content = content.strip()
-        if content.startswith("```json"):
-            content = content[7:]
-        if content.startswith("```"):
-            content = content[3:]
-        if content.endswith("```"):
-            content = content[:-3]
-        return json.loads(content.strip())
-    
-    return make_request()
+
+
+async def json_call_many(
+    prompts: list[str], schema: Dict[str, Any], concurrency: int = 8
+) -> list[Dict[str, Any] | BaseException]:
+    """
+    Run json_call for several prompts concurrently, at most `concurrency` in flight.
+
+    Each call goes through the on-disk cache and rate-limit retries on a worker thread while
+    sharing the client's connection pool. Results keep the order of `prompts`; a failed
+    prompt yields its exception in place of a result.
+    """
+    slots = asyncio.Semaphore(concurrency)
+
+    async def _one(prompt: str) -> Dict[str, Any]:
+        async with slots:
+            return await asyncio.to_thread(json_call, prompt, schema)
+
+    return await asyncio.gather(*(_one(p) for p in prompts), return_exceptions=True)
 
 
 def text_call(prompt: str, model: str | None = None) -> str:
     """Generate text using Gemini."""
-    
-    @retry(
-        stop=stop_after_attempt(5),
-        wait=wait_exponential(multiplier=1, min=2, max=60),
-        retry=retry_if_exception(is_rate_limit_error),
-        reraise=True
-    )
-    def make_request() -> str:
-        client = _get_client()
-        response = client.models.generate_content(
-            model=MODEL_NAME,
-            contents=prompt
-        )
-        return response.text or ""
-    
-    return make_request()
+    return _text_request(prompt)
@@ -1,8 +1,41 @@
+import atexit
+import logging
+import logging.handlers
+import queue
+import sys
+
 from loguru import logger
 
 logger.remove()
+# enqueue=True hands records to loguru's writer thread instead of writing on the caller
 logger.add(
-    lambda msg: print(msg, end=""),
+    sys.stderr,
     colorize=True,
     format="<green>{time}</green> | <level>{level}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan> - <level>{message}</level>",
+    enqueue=True,
+    backtrace=False,
+    diagnose=False,
 )
+
+_listener: logging.handlers.QueueListener | None = None
+
+
+def setup_logging(level: str | int = logging.INFO) -> None:
+    """
+    Route stdlib logging through a queue drained by a background listener thread.
+
+    Callers (including coroutines under asyncio.gather fan-out) only pay for a queue put;
+    formatting and stream writes happen off the calling thread. Safe to call repeatedly.
+    """
+    global _listener
+    root = logging.getLogger()
+    root.setLevel(level)
+    if _listener is not None:
+        return
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    stream = logging.StreamHandler()
+    stream.setFormatter(logging.Formatter("%(asctime)s | %(levelname)s | %(name)s - %(message)s"))
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    _listener = logging.handlers.QueueListener(log_queue, stream, respect_handler_level=True)
+    _listener.start()
+    atexit.register(_listener.stop)
@@ -1,7 +1,12 @@
 from datetime import datetime
-from typing import List, Optional
+from sys import intern
+from typing import Annotated, List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import AfterValidator, BaseModel, Field
+
+# Adapter names, finding keys and statuses come from a small vocabulary; interning them at
+# validation makes every later equality check and sort comparison an identity check.
+InternedStr = Annotated[str, AfterValidator(intern)]
 
 
 class Citation(BaseModel):
@@ -13,10 +18,10 @@ class Citation(BaseModel):
 
 
 class AdapterFinding(BaseModel):
-    key: str
+    key: InternedStr
     value: str
-    status: str  # "confirmed" | "not_found" | "inconsistent" | "unknown"
-    adapter: str
+    status: InternedStr  # "confirmed" | "not_found" | "inconsistent" | "unknown"
+    adapter: InternedStr
     observed_at: datetime
     snippet: Optional[str] = None
     citations: List[Citation] = Field(default_factory=list)
@@ -1,57 +1,81 @@
-from jinja2 import Template
+from jinja2 import DictLoader, Environment
 
-from ..models.recon import TruthCard
+from ..models.recon import Discrepancy, TruthCard
 
-TPL = Template(
-    """
+HEADER_SRC = """
 <h3>Iva Truth Meter — {{ company }}</h3>
 <p><b>URL:</b> {{ url }}<br/><b>Summary:</b> {{ summary }}<br/><b>Confidence:</b> {{ conf }}%<br/><b>Generated:</b> {{ generated }}</p>
-{% for d in discrepancies %}
-<div>
-  <b>{{ d.type }}</b> ({{ d.severity }}, {{ (d.confidence*100)|round }}%):
-  {% set claim_texts = d.related_claim_texts if d.related_claim_texts else ([d.claim_text] if d.claim_text else []) %}
-  {% if claim_texts %}
-  <div><b>Claims:</b>
-    <ul>{% for text in claim_texts %}<li>{{ text }}</li>{% endfor %}</ul>
-  </div>
-  {% endif %}
-  {% if d.related_claims and d.related_claims|length > 1 %}<div><b>Related claim IDs:</b> {{ d.related_claims|join(', ') }}</div>{% endif %}
-  <div>Why: {{ d.why_it_matters }}</div>
-  <div>Expected evidence: {{ d.expected_evidence }}</div>
-  <div>Verdict: {{ d.explanation.verdict }} ({{ (d.explanation.confidence*100)|round }}%)</div>
-  {% if d.explanation.notes %}
-  <div>Notes:
-    <ul>{% for note in d.explanation.notes.split('\n') %}<li>{{ note }}</li>{% endfor %}</ul>
-  </div>
-  {% endif %}
-  {% if d.explanation.follow_up_actions %}
-  <div>Follow-ups:
-    <ul>{% for action in d.explanation.follow_up_actions %}<li>{{ action }}</li>{% endfor %}</ul>
-  </div>
-  {% endif %}
-  {% if d.explanation.supporting_evidence %}
-  <div>Evidence:
-    <ul>{% for e in d.explanation.supporting_evidence %}<li>{{ e.adapter }} • {{ e.finding_key }} — {{ e.summary }}{% if e.citation_urls %} (<a href="{{ e.citation_urls[0] }}" target="_blank" rel="noopener">Source</a>){% endif %}</li>{% endfor %}</ul>
-  </div>
-  {% endif %}
-  {% if d.provenance %}
-  <div>Provenance:
-    <ul>{% for p in d.provenance %}<li>{{ p.adapter }} @ {{ p.observed_at }}{% if p.snippet %} — {{ p.snippet }}{% endif %}{% if p.source_urls %} (<a href="{{ p.source_urls[0] }}" target="_blank" rel="noopener">Source</a>){% endif %}</li>{% endfor %}</ul>
-  </div>
-  {% endif %}
-</div>
-{% endfor %}
-<small>Advisory only — not legal advice.</small>
 """
+
+# Compiled once at import and cached by the loader. Jinja renders only the card-level shell;
+# discrepancy blocks are built in _render_discrepancy because per-row branch dispatch
+# dominated render time.
+_ENV = Environment(
+    loader=DictLoader({"header": HEADER_SRC}),
+    auto_reload=False,
+    keep_trailing_newline=True,
+    trim_blocks=True,
+    lstrip_blocks=True,
 )
+HEADER_TPL = _ENV.get_template("header")
+
+FOOTER = "\n<small>Advisory only — not legal advice.</small>"
+
+
+def _list_section(title: str, items: list[str]) -> str:
+    if not items:
+        return ""
+    return f"\n  <div>{title}:\n    <ul>{''.join(items)}</ul>\n  </div>\n  "
+
+
+def _render_discrepancy(d: Discrepancy) -> str:
+    ex = d.explanation
+    claim_texts = d.related_claim_texts or ([d.claim_text] if d.claim_text else [])
+    claims = ""
+    if claim_texts:
+        items = "".join(f"<li>{text}</li>" for text in claim_texts)
+        claims = f"\n  <div><b>Claims:</b>\n    <ul>{items}</ul>\n  </div>\n  "
+    related = ""
+    if d.related_claims and len(d.related_claims) > 1:
+        related = f"<div><b>Related claim IDs:</b> {', '.join(d.related_claims)}</div>"
+    notes = [f"<li>{note}</li>" for note in ex.notes.split("\n")] if ex.notes else []
+    follow_ups = [f"<li>{action}</li>" for action in ex.follow_up_actions]
+    evidence = []
+    for e in ex.supporting_evidence:
+        source = (
+            f' (<a href="{e.citation_urls[0]}" target="_blank" rel="noopener">Source</a>)'
+            if e.citation_urls
+            else ""
+        )
+        evidence.append(f"<li>{e.adapter} • {e.finding_key} — {e.summary}{source}</li>")
+    provenance = []
+    for p in d.provenance:
+        snippet = f" — {p.snippet}" if p.snippet else ""
+        source = (
+            f' (<a href="{p.source_urls[0]}" target="_blank" rel="noopener">Source</a>)'
+            if p.source_urls
+            else ""
+        )
+        provenance.append(f"<li>{p.adapter} @ {p.observed_at}{snippet}{source}</li>")
+    return (
+        f"\n<div>\n  <b>{d.type}</b> ({d.severity}, {round(d.confidence * 100, 0)}%):\n  \n  "
+        f"{claims}\n  {related}\n"
+        f"  <div>Why: {d.why_it_matters}</div>\n"
+        f"  <div>Expected evidence: {d.expected_evidence}</div>\n"
+        f"  <div>Verdict: {ex.verdict} ({round(ex.confidence * 100, 0)}%)</div>\n  "
+        f"{_list_section('Notes', notes)}\n  "
+        f"{_list_section('Follow-ups', follow_ups)}\n  "
+        f"{_list_section('Evidence', evidence)}\n  "
+        f"{_list_section('Provenance', provenance)}\n</div>\n"
+    )
 
 
 def render_html(card: TruthCard) -> str:
-    return TPL.render(
+    header = HEADER_TPL.render(
         company=card.company,
         url=card.url,
         summary=card.severity_summary,
         conf=round(card.overall_confidence * 100),
         generated=card.generated_at,
-        discrepancies=card.discrepancies,
     )
+    return header + "".join(_render_discrepancy(d) for d in card.discrepancies) + FOOTER
@@ -1,14 +1,16 @@
-import json
 from typing import Optional
 
-import httpx
+import orjson
 
 from ..config import settings
+from ..ingestion.fetch import get_client
 from ..models.recon import TruthCard
 
+_SEVERITY_EMOJI = {"high": "🛑", "med": "⚠️", "low": "ℹ️"}
+
 
 def _severity_emoji(sev: str) -> str:
-    return {"high": "🛑", "med": "⚠️", "low": "ℹ️"}.get(sev, "ℹ️")
+    return _SEVERITY_EMOJI.get(sev, "ℹ️")
 
 
 def card_to_blocks(card: TruthCard):
@@ -77,13 +79,14 @@ def card_to_blocks(card: TruthCard):
 async def post_slack(card: TruthCard, channel: Optional[str] = None):
     webhook = settings.slack_webhook_url
     if webhook:
-        async with httpx.AsyncClient() as client:
-            payload = {"text": f"Iva Truth Meter: {card.company}", "blocks": card_to_blocks(card)}
-            r = await client.post(webhook, json=payload, timeout=20)
-            r.raise_for_status()
+        # Shared pooled client: keeps the connection to Slack alive between posts
+        client = await get_client()
+        payload = {"text": f"Iva Truth Meter: {card.company}", "blocks": card_to_blocks(card)}
+        r = await client.post(webhook, json=payload, timeout=20)
+        r.raise_for_status()
     else:
         # No webhook, print JSON for demo
-        print(json.dumps({"blocks": card_to_blocks(card)}, indent=2))
+        print(orjson.dumps({"blocks": card_to_blocks(card)}, option=orjson.OPT_INDENT_2).decode())
 
 
 async def post_slack_alert(alert) -> None:
@@ -134,7 +137,7 @@ async def post_slack_alert(alert) -> None:
             }
         )
 
-    async with httpx.AsyncClient() as client:
-        payload = {"text": f"Iva Alert: {alert.message}", "blocks": blocks}
-        r = await client.post(webhook, json=payload, timeout=20)
-        r.raise_for_status()
+    client = await get_client()
+    payload = {"text": f"Iva Alert: {alert.message}", "blocks": blocks}
+    r = await client.post(webhook, json=payload, timeout=20)
+    r.raise_for_status()
@@ -2,14 +2,10 @@ from typing import List
 
 from ..models.sources import AdapterFinding
 
+# Evidence weight contributed by each finding status; other statuses add nothing
+_STATUS_WEIGHT = {"confirmed": 0.25, "inconsistent": 0.2, "not_found": 0.15}
+
 
 def confidence_from_findings(findings: List[AdapterFinding]) -> float:
-    score = 0.0
-    for f in findings:
-        if f.status == "confirmed":
-            score += 0.25
-        if f.status == "inconsistent":
-            score += 0.2
-        if f.status == "not_found":
-            score += 0.15
-    return min(1.0, score)
+    weight = _STATUS_WEIGHT.get
+    return min(1.0, sum((weight(f.status, 0.0) for f in findings), 0.0))
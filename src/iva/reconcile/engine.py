@@ -1,5 +1,11 @@
+import ast
+import logging
+import re
+from collections import Counter
 from datetime import UTC, datetime
-from typing import List
+from typing import Callable, List
+
+import orjson
 
 from ..models.claims import ClaimSet, ExtractedClaim
 from ..models.recon import (
@@ -13,34 +19,36 @@ from ..models.sources import AdapterFinding
 from .citations import confidence_from_findings
 from .severity import score_severity
 
+logger = logging.getLogger(__name__)
+
+
+FindingsBundle = tuple[List[EvidencePointer], List[FindingProvenance]]
+
 
-def _evidence_from_findings(findings: List[AdapterFinding]) -> List[EvidencePointer]:
+def _findings_bundle(findings: List[AdapterFinding]) -> FindingsBundle:
+    """Evidence pointers and provenance for `findings`, built in one pass over them."""
     evidence: List[EvidencePointer] = []
+    provenance: List[FindingProvenance] = []
     for f in findings:
+        urls = [c.url for c in f.citations if c.url]
         evidence.append(
-            EvidencePointer(
+            EvidencePointer.model_construct(
                 adapter=f.adapter,
                 finding_key=f.key,
                 summary=f.snippet or f.value or f.status,
-                citation_urls=[c.url for c in f.citations if c.url],
+                citation_urls=urls,
             )
         )
-    return evidence
-
-
-def _provenance_from_findings(findings: List[AdapterFinding]) -> List[FindingProvenance]:
-    provenance: List[FindingProvenance] = []
-    for f in findings:
         provenance.append(
-            FindingProvenance(
+            FindingProvenance.model_construct(
                 adapter=f.adapter,
                 finding_key=f.key,
                 observed_at=f.observed_at,
                 snippet=f.snippet,
-                source_urls=[c.url for c in f.citations if c.url],
+                source_urls=urls,
             )
         )
-    return provenance
+    return evidence, provenance
 
 
 def _verdict_for_severity(severity: str) -> str:
@@ -54,15 +62,16 @@ def _verdict_for_severity(severity: str) -> str:
 def _make_explanation(
     severity: str,
     confidence: float,
-    findings: List[AdapterFinding],
-    follow_ups: List[str],
+    evidence: List[EvidencePointer],
+    follow_ups: tuple[str, ...],
     notes: str | None = None,
 ) -> ExplanationBundle:
-    return ExplanationBundle(
+    # follow_ups is a constant tuple at every call site; merging appends to the list copy.
+    return ExplanationBundle.model_construct(
         verdict=_verdict_for_severity(severity),
-        supporting_evidence=_evidence_from_findings(findings),
+        supporting_evidence=list(evidence),
         confidence=confidence,
-        follow_up_actions=follow_ups,
+        follow_up_actions=list(follow_ups),
         notes=notes,
     )
 
@@ -75,861 +84,1089 @@ def _build_discrepancy(
     why: str,
     expected: str,
     findings: List[AdapterFinding],
-    follow_ups: List[str],
+    follow_ups: tuple[str, ...],
+    bundle: FindingsBundle | None = None,
 ) -> Discrepancy:
-    return Discrepancy(
+    # Every input is an already-validated model or an engine literal, so skip revalidation.
+    # Lists are still copied so pooled findings/evidence stay independent per discrepancy.
+    evidence, provenance = bundle if bundle is not None else _findings_bundle(findings)
+    return Discrepancy.model_construct(
         claim_id=claim.id,
         type=dtype,
         severity=severity,
         confidence=confidence,
         why_it_matters=why,
         expected_evidence=expected,
-        findings=findings,
+        findings=list(findings),
         claim_text=claim.claim_text,
-        explanation=_make_explanation(severity, confidence, findings, follow_ups),
-        provenance=_provenance_from_findings(findings),
+        explanation=_make_explanation(severity, confidence, evidence, follow_ups),
+        provenance=list(provenance),
         related_claims=[claim.id],
         related_claim_texts=[claim.claim_text] if claim.claim_text else [],
     )
 
 
 def _fingerprint_findings(findings: List[AdapterFinding]) -> tuple:
-    return tuple(sorted((f.adapter, f.key, f.value, f.status) for f in findings))
+    # adapter, key and status are interned by AdapterFinding, so sort comparisons on them
+    # mostly resolve by identity.
+    items = [(f.adapter, f.key, f.value, f.status) for f in findings]
+    items.sort()
+    return tuple(items)
 
 
-def _merge_or_add_discrepancy(
-    discrepancies: List[Discrepancy], new_discrepancy: Discrepancy
-) -> None:
-    if new_discrepancy.type == "marketing_metric_unverified":
-        new_fp = _fingerprint_findings(new_discrepancy.findings)
-        for existing in discrepancies:
-            if (
-                existing.type == new_discrepancy.type
-                and _fingerprint_findings(existing.findings) == new_fp
-            ):
-                added_claim = False
-                for idx, cid in enumerate(new_discrepancy.related_claims):
-                    if cid not in existing.related_claims:
-                        existing.related_claims.append(cid)
-                        added_claim = True
-                        if idx < len(new_discrepancy.related_claim_texts):
-                            text = new_discrepancy.related_claim_texts[idx]
-                            if text and text not in existing.related_claim_texts:
-                                existing.related_claim_texts.append(text)
-                for action in new_discrepancy.explanation.follow_up_actions:
-                    if action not in existing.explanation.follow_up_actions:
-                        existing.explanation.follow_up_actions.append(action)
-                if added_claim and new_discrepancy.claim_text:
-                    extra_note = f"Also flagged claim: {new_discrepancy.claim_text}"
-                    current_notes = existing.explanation.notes or ""
-                    if extra_note not in current_notes:
-                        existing.explanation.notes = (
-                            current_notes + ("\n" if current_notes else "") + extra_note
-                        ) or extra_note
-                return
-    discrepancies.append(new_discrepancy)
-
-
-def _has_confirmed_metric(findings: List[AdapterFinding], keywords: List[str]) -> bool:
-    keyword_set = [kw.lower() for kw in keywords]
-    for f in findings:
-        if getattr(f, "status", "") != "confirmed":
-            continue
-        haystack = " ".join(
-            filter(
-                None, [getattr(f, "key", ""), getattr(f, "value", ""), getattr(f, "snippet", "")]
-            )
-        ).lower()
-        if any(kw in haystack for kw in keyword_set):
-            return True
-    return False
+# Membership sets mirroring a merge target's related_claims, related_claim_texts and
+# follow_up_actions lists.
+MergeSeen = tuple[set[str], set[str], set[str]]
 
 
-def reconcile(claims: ClaimSet, adapter_results: dict[str, list]) -> TruthCard:
-    """
-    Reconcile extracted claims against verification sources.
+def _merge_seen(existing: Discrepancy) -> MergeSeen:
+    return (
+        set(existing.related_claims),
+        set(existing.related_claim_texts),
+        set(existing.explanation.follow_up_actions),
+    )
 
-    This engine checks claims against multiple adapters and flags discrepancies:
-    - Licensing claims vs NMLS/FINTRAC/EDGAR data
-    - Partner bank claims vs public disclosures
-    - Security certifications vs trust centers
-    - Marketing metrics vs regulatory filings
+
+def _merge_into(existing: Discrepancy, new_discrepancy: Discrepancy, seen: MergeSeen) -> None:
+    """Fold a duplicate discrepancy's claims, follow-ups and claim note into `existing`."""
+    claims_seen, texts_seen, actions_seen = seen
+    added_claim = False
+    for idx, cid in enumerate(new_discrepancy.related_claims):
+        if cid not in claims_seen:
+            claims_seen.add(cid)
+            existing.related_claims.append(cid)
+            added_claim = True
+            if idx < len(new_discrepancy.related_claim_texts):
+                text = new_discrepancy.related_claim_texts[idx]
+                if text and text not in texts_seen:
+                    texts_seen.add(text)
+                    existing.related_claim_texts.append(text)
+    for action in new_discrepancy.explanation.follow_up_actions:
+        if action not in actions_seen:
+            actions_seen.add(action)
+            existing.explanation.follow_up_actions.append(action)
+    if added_claim and new_discrepancy.claim_text:
+        extra_note = f"Also flagged claim: {new_discrepancy.claim_text}"
+        current_notes = existing.explanation.notes or ""
+        if extra_note not in current_notes:
+            existing.explanation.notes = (
+                current_notes + ("\n" if current_notes else "") + extra_note
+            ) or extra_note
+
+
+def _merge_duplicates(discrepancies: List[Discrepancy]) -> List[Discrepancy]:
     """
-    discrepancies: List[Discrepancy] = []
+    Collapse marketing metric discrepancies backed by identical findings into the first one,
+    in a single pass. Grouping is by hashed fingerprint rather than a sort so the result
+    keeps the order in which discrepancies were first raised.
+    """
+    merged: List[Discrepancy] = []
+    first_by_fingerprint: dict[tuple, Discrepancy] = {}
+    # Discrepancies built from the same pool hold the very same finding objects, so an
+    # identity key matches them without sorting; the findings stay alive for the whole pass.
+    first_by_identity: dict[tuple[int, ...], Discrepancy] = {}
+    seen_by_target: dict[int, MergeSeen] = {}
+    for d in discrepancies:
+        if d.type == "marketing_metric_unverified":
+            identity = tuple(map(id, d.findings))
+            existing = first_by_identity.get(identity)
+            if existing is None:
+                fingerprint = _fingerprint_findings(d.findings)
+                existing = first_by_fingerprint.get(fingerprint)
+                if existing is None:
+                    first_by_fingerprint[fingerprint] = d
+                first_by_identity[identity] = existing if existing is not None else d
+            if existing is not None:
+                seen = seen_by_target.get(id(existing))
+                if seen is None:
+                    seen = seen_by_target[id(existing)] = _merge_seen(existing)
+                _merge_into(existing, d, seen)
+                continue
+        merged.append(d)
+    return merged
+
+
+# Combined finding pools shared by several claims; built once per reconcile() call.
+_POOLS: tuple[tuple[str, ...], ...] = (
+    ("bank_partners", "news"),
+    ("edgar", "news", "press_metrics"),
+    ("cfpb", "edgar"),
+    ("trust_center", "edgar"),
+    ("edgar_filings", "news"),
+    ("edgar_filings", "press_metrics"),
+    ("edgar_filings", "press_releases"),
+)
+_SOURCES = (
+    "nmls",
+    "trust_center",
+    "edgar_filings",
+    "earnings_calls",
+    "press_releases",
+)
 
-    print(f"\n[RECONCILE] Processing {len(claims.claims)} claims...")
 
-    for cl in claims.claims:
-        print(f"[RECONCILE] Checking claim: [{cl.category}] {cl.claim_text[:60]}...")
-        findings = []
-        if cl.category == "licensing":
-            findings = adapter_results.get("nmls", [])
-            # Simple rule: if claim says "licensed in 30 states" but NMLS count < 20
-            if cl.values and any(v.isdigit() and int(v) >= 30 for v in cl.values):
-                states_list = []
-                for f in findings:
-                    if hasattr(f, "key") and f.key == "us_mtl_states":
-                        import ast
-
-                        try:
-                            states_list = ast.literal_eval(f.value)
-                        except Exception:
-                            states_list = []
-                if states_list and len(states_list) < 20:
-                    ev = confidence_from_findings(findings)
-                    sev, conf = score_severity(cl.category, "underlicensed_vs_claim", ev)
-                    discrepancies.append(
-                        _build_discrepancy(
-                            claim=cl,
-                            dtype="underlicensed_vs_claim",
-                            severity=sev,
-                            confidence=conf,
-                            why="Compliance and go-to-market risk; may impact money movement and onboarding.",
-                            expected="NMLS roster export or auditor letter with current state licenses.",
-                            findings=findings,
-                            follow_ups=[
-                                "Request updated NMLS roster from the compliance owner.",
-                                "Align marketing copy with current state coverage.",
-                            ],
-                        )
-                    )
-        if cl.category == "partner_bank":
-            bank_findings = adapter_results.get("bank_partners", []) + adapter_results.get(
-                "news", []
-            )
-            has_confirmed = any(getattr(f, "status", None) == "confirmed" for f in bank_findings)
-            if not has_confirmed:
-                ev = confidence_from_findings(bank_findings)
-                sev, conf = score_severity(cl.category, "partner_unverified", ev)
-                discrepancies.append(
-                    _build_discrepancy(
-                        claim=cl,
-                        dtype="partner_unverified",
-                        severity=sev,
-                        confidence=conf,
-                        why="Sponsor bank claims require verification; affects issuing and compliance.",
-                        expected="Bank partner page listing or joint press release.",
-                        findings=bank_findings,
-                        follow_ups=[
-                            "Secure sponsor bank confirmation or contract excerpt.",
-                            "Escalate to partnerships lead for attestation.",
-                        ],
-                    )
-                )
-        # SECURITY CERTIFICATIONS
-        if cl.category == "security":
-            sec_findings = adapter_results.get("trust_center", [])
-
-            # Check SOC 2 claims
-            if "SOC 2" in (cl.claim_text or ""):
-                if any(
-                    getattr(f, "key", None) == "security_txt"
-                    and getattr(f, "status", None) == "not_found"
-                    for f in sec_findings
-                ):
-                    ev = confidence_from_findings(sec_findings)
-                    sev, conf = score_severity(cl.category, "soc2_unsubstantiated", ev)
-                    discrepancies.append(
-                        _build_discrepancy(
-                            claim=cl,
-                            dtype="soc2_unsubstantiated",
-                            severity=sev,
-                            confidence=conf,
-                            why="Unverified SOC 2 claim can be misleading; request auditor letter or trust center link.",
-                            expected="SOC 2 Type II auditor letter (date, scope) or trust center reference.",
-                            findings=sec_findings,
-                            follow_ups=[
-                                "Request SOC 2 auditor letter or trust center link from security lead.",
-                                "Pause external messaging until attestation is confirmed.",
-                            ],
-                        )
-                    )
+# Metric groups a confirmed finding can substantiate: group -> (pool, keywords).
+_METRIC_GROUPS: dict[str, tuple[str, tuple[str, ...]]] = {
+    "customer": ("edgar+news+press_metrics", ("customer", "user", "merchant")),
+    "volume": ("edgar+news+press_metrics", ("volume", "payment", "processed", "gmv")),
+    "account": ("edgar_filings+press_metrics", ("user", "customer", "merchant", "account")),
+}
 
-            # Check ISO certifications
-            if "ISO 27001" in (cl.claim_text or "") or "ISO" in (cl.claim_text or ""):
-                if not any(
-                    getattr(f, "key", None) == "iso_cert"
-                    and getattr(f, "status", None) == "confirmed"
-                    for f in sec_findings
-                ):
-                    ev = confidence_from_findings(sec_findings)
-                    sev, conf = score_severity(cl.category, "iso_unverified", ev)
-                    discrepancies.append(
-                        _build_discrepancy(
-                            claim=cl,
-                            dtype="iso_unverified",
-                            severity=sev,
-                            confidence=conf,
-                            why="ISO certification claims should be verifiable through certificate registries.",
-                            expected="ISO certificate number or listing in certification body database.",
-                            findings=sec_findings,
-                            follow_ups=[
-                                "Collect ISO certificate ID and certification body from security team.",
-                                "Update claim copy with verified scope and coverage.",
-                            ],
-                        )
-                    )
 
-            # Check PCI DSS claims
-            if "PCI" in (cl.claim_text or ""):
-                ev = confidence_from_findings(sec_findings)
-                sev, conf = score_severity(cl.category, "pci_requires_verification", ev)
-                discrepancies.append(
-                    _build_discrepancy(
-                        claim=cl,
-                        dtype="pci_requires_verification",
-                        severity=sev,
-                        confidence=conf,
-                        why="PCI DSS compliance level should be verified with QSA attestation.",
-                        expected="PCI DSS Attestation of Compliance (AOC) or QSA letter with level and date.",
-                        findings=sec_findings,
-                        follow_ups=[
-                            "Request current AOC or QSA attestation letter.",
-                            "Confirm PCI scope with payments ops stakeholder.",
-                        ],
-                    )
+def _haystacks_for(findings: List[AdapterFinding]) -> list[tuple[AdapterFinding, str]]:
+    """Confirmed findings paired with their lower-cased key/value/snippet text."""
+    return [
+        (f, " ".join(filter(None, (f.key, f.value, f.snippet))).lower())
+        for f in findings
+        if f.status == "confirmed"
+    ]
+
+
+class _FindingPools(dict[str, list]):
+    """
+    Finding lists by source or pool name, with their evidence strength, evidence/provenance
+    bundle and `_FLAGS` checks computed once.
+    """
+
+    __slots__ = ("_confidence", "_bundles", "_flags", "_severity")
+
+    def __init__(self, adapter_results: dict[str, list]) -> None:
+        super().__init__(adapter_results)
+        self._confidence: dict[str, float] = {}
+        self._bundles: dict[str, FindingsBundle] = {}
+        self._flags: dict[str, bool] = {}
+        self._severity: dict[tuple[str, str, float], tuple[str, float]] = {}
+
+    def confidence(self, name: str) -> float:
+        ev = self._confidence.get(name)
+        if ev is None:
+            ev = self._confidence[name] = confidence_from_findings(self[name])
+        return ev
+
+    def bundle(self, name: str) -> FindingsBundle:
+        bundle = self._bundles.get(name)
+        if bundle is None:
+            bundle = self._bundles[name] = _findings_bundle(self[name])
+        return bundle
+
+    def has(self, flag: str) -> bool:
+        """Whether any finding in the flag's source matches its `_FLAGS` predicate."""
+        found = self._flags.get(flag)
+        if found is None:
+            source, predicate = _FLAGS[flag]
+            found = self._flags[flag] = any(predicate(f) for f in self[source])
+        return found
+
+    def severity(self, category: str, dtype: str, ev: float) -> tuple[str, float]:
+        """
+        `score_severity` memoized for this run. Scoping the cache to the run keeps it bounded
+        by the handful of (category, dtype, pool strength) combinations one run produces; a
+        process-wide cache keyed on float strengths would grow without limit.
+        """
+        key = (category, dtype, ev)
+        scored = self._severity.get(key)
+        if scored is None:
+            scored = self._severity[key] = score_severity(category, dtype, ev)
+        return scored
+
+
+def _pool_findings(adapter_results: dict[str, list]) -> _FindingPools:
+    """
+    Copy of `adapter_results` in which every source the handlers read is present, plus each
+    `_POOLS` concatenation under its "+"-joined key (e.g. "cfpb+edgar") and, for every
+    `_METRIC_GROUPS` entry, the confirmed findings of its pool that mention one of its
+    keywords under "confirmed:<group>".
+    """
+    pooled = _FindingPools(adapter_results)
+    for name in _SOURCES:
+        pooled.setdefault(name, [])
+    for names in _POOLS:
+        pooled["+".join(names)] = [f for name in names for f in adapter_results.get(name, [])]
+
+    haystacks: dict[str, list[tuple[AdapterFinding, str]]] = {}
+    for group, (pool, keywords) in _METRIC_GROUPS.items():
+        if pool not in haystacks:
+            haystacks[pool] = _haystacks_for(pooled[pool])
+        pooled[f"confirmed:{group}"] = [
+            f for f, haystack in haystacks[pool] if any(kw in haystack for kw in keywords)
+        ]
+    return pooled
+
+
+def _terms(*words: str) -> re.Pattern[str]:
+    """Compile a substring alternation: `.search(text)` is `any(w in text for w in words)`."""
+    return re.compile("|".join(map(re.escape, words)))
+
+
+# Keyword predicates, matched against the lower-cased claim text unless noted.
+_CUSTOMER_TERMS = _terms("customer", "user")  # claim kind + text
+_VOLUME_TERMS = _terms("volume", "transaction", "processed", "payment")  # claim kind + text
+_VAGUE_MARKETING_TERMS = _terms("leading", "fastest", "best", "#1", "top", "premier")
+_AML_TERMS = _terms("AML", "KYC", "BSA")  # upper-cased text
+_PRIVACY_TERMS = _terms("GDPR", "CCPA")  # upper-cased text
+_REVENUE_TERMS = _terms("revenue", "sales", "$")
+_MAGNITUDE_TERMS = _terms("billion", "million")  # lower-cased claim value
+_PROFIT_TERMS = _terms("profit", "income", "loss", "profitable", "earnings")
+_PROFITABLE_TERMS = _terms("profitable", "profit", "positive")
+_VAGUE_POSITION_TERMS = _terms(
+    "leading", "#1", "largest", "fastest", "best", "top", "premier", "dominant"
+)
+_FORWARD_LOOKING_TERMS = _terms(
+    "expect", "believe", "anticipate", "plan", "forecast", "project", "guidance", "target"
+)
+_DISCLAIMER_TERMS = _terms("forward-looking", "cautionary", "safe harbor", "risks")
+_GUIDANCE_TERMS = _terms("$", "revenue", "earnings", "forecast")
+_LITIGATION_TERMS = _terms(
+    "lawsuit", "litigation", "legal action", "sued", "complaint", "dispute", "settlement"
+)
+_ACCOUNT_TERMS = _terms("user", "customer", "merchant", "account")
+_MATERIAL_EVENT_TERMS = _terms(
+    "acquired", "merger", "partnership", "ceo", "executive", "leadership", "agreement"
+)
+
+# Finding keys. Adapters name keys "<marker>" or "<marker>_<n>", so markers are prefixes.
+_SEC_IDENTITY_KEYS = frozenset({"edgar_cik", "edgar_company_name"})
+_RECENT_FILING_PREFIXES = ("edgar_8k", "edgar_latest_10q", "edgar_latest_10k")
+_HISTORICAL_CHANGE_PREFIXES = ("historical_modified_claims", "historical_removed_claims")
+
+# Claim-independent "does any finding in <source> match" checks: flag -> (source, predicate).
+_FLAGS: dict[str, tuple[str, Callable[[AdapterFinding], bool]]] = {
+    "bank_confirmed": ("bank_partners+news", lambda f: f.status == "confirmed"),
+    "security_txt_missing": (
+        "trust_center",
+        lambda f: f.key == "security_txt" and f.status == "not_found",
+    ),
+    "iso_cert_confirmed": (
+        "trust_center",
+        lambda f: f.key == "iso_cert" and f.status == "confirmed",
+    ),
+    "sec_identity_confirmed": (
+        "cfpb+edgar",
+        lambda f: f.key in _SEC_IDENTITY_KEYS and f.status == "confirmed",
+    ),
+    "recent_filings": ("edgar_filings", lambda f: f.key.startswith(_RECENT_FILING_PREFIXES)),
+    "earnings_transcript": (
+        "earnings_calls",
+        lambda f: f.key.startswith("earnings_transcript") and f.status == "confirmed",
+    ),
+    "item_3_legal": ("edgar_filings", lambda f: f.key == "edgar_10k_item_3_legal"),
+    "recent_8k": ("edgar_filings", lambda f: f.key.startswith("edgar_8k")),
+    "press_release_confirmed": (
+        "press_releases",
+        lambda f: f.key.startswith("press_release") and f.status == "confirmed",
+    ),
+}
+
+
+Handler = Callable[[ExtractedClaim, _FindingPools, List[Discrepancy]], None]
+
+
+def _parse_state_list(value: str) -> list:
+    """Parse an NMLS state list: JSON from the adapter, or a Python list literal."""
+    try:
+        parsed = orjson.loads(value)
+    except orjson.JSONDecodeError:
+        try:
+            parsed = ast.literal_eval(value)
+        except Exception:
+            return []
+    return parsed if isinstance(parsed, list) else []
+
+
+def _handle_licensing(
+    cl: ExtractedClaim,
+    adapter_results: _FindingPools,
+    discrepancies: List[Discrepancy],
+) -> None:
+    findings = adapter_results["nmls"]
+    if not findings:
+        return
+    # Simple rule: if claim says "licensed in 30 states" but NMLS count < 20
+    if cl.values and any(v.isdigit() and int(v) >= 30 for v in cl.values):
+        states_list = []
+        # The last us_mtl_states finding is authoritative.
+        for f in reversed(findings):
+            if f.key == "us_mtl_states":
+                states_list = _parse_state_list(f.value)
+                break
+        if states_list and len(states_list) < 20:
+            ev = adapter_results.confidence("nmls")
+            sev, conf = adapter_results.severity(cl.category, "underlicensed_vs_claim", ev)
+            discrepancies.append(
+                _build_discrepancy(
+                    claim=cl,
+                    dtype="underlicensed_vs_claim",
+                    severity=sev,
+                    confidence=conf,
+                    why="Compliance and go-to-market risk; may impact money movement and onboarding.",
+                    expected="NMLS roster export or auditor letter with current state licenses.",
+                    findings=findings,
+                    bundle=adapter_results.bundle("nmls"),
+                    follow_ups=(
+                        "Request updated NMLS roster from the compliance owner.",
+                        "Align marketing copy with current state coverage.",
+                    ),
                 )
+            )
 
-        # MARKETING CLAIMS - Flag unverifiable or exaggerated claims
-        if cl.category == "marketing":
-            market_findings = (
-                adapter_results.get("edgar", [])
-                + adapter_results.get("news", [])
-                + adapter_results.get("press_metrics", [])
+
+def _handle_partner_bank(
+    cl: ExtractedClaim,
+    adapter_results: _FindingPools,
+    discrepancies: List[Discrepancy],
+) -> None:
+    bank_findings = adapter_results["bank_partners+news"]
+    if not adapter_results.has("bank_confirmed"):
+        ev = adapter_results.confidence("bank_partners+news")
+        sev, conf = adapter_results.severity(cl.category, "partner_unverified", ev)
+        discrepancies.append(
+            _build_discrepancy(
+                claim=cl,
+                dtype="partner_unverified",
+                severity=sev,
+                confidence=conf,
+                why="Sponsor bank claims require verification; affects issuing and compliance.",
+                expected="Bank partner page listing or joint press release.",
+                findings=bank_findings,
+                bundle=adapter_results.bundle("bank_partners+news"),
+                follow_ups=(
+                    "Secure sponsor bank confirmation or contract excerpt.",
+                    "Escalate to partnerships lead for attestation.",
+                ),
             )
-            kind_text = " ".join(filter(None, [cl.claim_kind, cl.claim_text])).lower()
+        )
 
-            # Check customer count claims - only flag if NOT confirmed
-            if "customer" in kind_text or "user" in kind_text:
-                has_confirmed = _has_confirmed_metric(
-                    market_findings, ["customer", "user", "merchant"]
-                )
-                if not has_confirmed:
-                    ev = confidence_from_findings(market_findings)
-                    sev, conf = score_severity(cl.category, "marketing_metric_unverified", ev)
-                    new_disc = _build_discrepancy(
-                        claim=cl,
-                        dtype="marketing_metric_unverified",
-                        severity=sev,
-                        confidence=conf,
-                        why="Customer counts are often marketing puffery; verify against SEC filings or audited reports.",
-                        expected="SEC 10-K/10-Q user metrics or audited customer count statement.",
-                        findings=market_findings,
-                        follow_ups=[
-                            "Request audited customer count from finance or strategy.",
-                            "Replace claim with certified figures before publication.",
-                        ],
-                    )
-                    _merge_or_add_discrepancy(discrepancies, new_disc)
 
-            # Check transaction volume claims - only flag if NOT confirmed
-            if any(word in kind_text for word in ["volume", "transaction", "processed", "payment"]):
-                has_confirmed = _has_confirmed_metric(
-                    market_findings, ["volume", "payment", "processed", "gmv"]
+# SECURITY CERTIFICATIONS
+def _handle_security(
+    cl: ExtractedClaim,
+    adapter_results: _FindingPools,
+    discrepancies: List[Discrepancy],
+) -> None:
+    claim_text = cl.claim_text or ""
+    sec_findings = adapter_results["trust_center"]
+
+    # Check SOC 2 claims
+    if "SOC 2" in claim_text:
+        if adapter_results.has("security_txt_missing"):
+            ev = adapter_results.confidence("trust_center")
+            sev, conf = adapter_results.severity(cl.category, "soc2_unsubstantiated", ev)
+            discrepancies.append(
+                _build_discrepancy(
+                    claim=cl,
+                    dtype="soc2_unsubstantiated",
+                    severity=sev,
+                    confidence=conf,
+                    why="Unverified SOC 2 claim can be misleading; request auditor letter or trust center link.",
+                    expected="SOC 2 Type II auditor letter (date, scope) or trust center reference.",
+                    findings=sec_findings,
+                    bundle=adapter_results.bundle("trust_center"),
+                    follow_ups=(
+                        "Request SOC 2 auditor letter or trust center link from security lead.",
+                        "Pause external messaging until attestation is confirmed.",
+                    ),
                 )
-                if not has_confirmed:
-                    ev = confidence_from_findings(market_findings)
-                    sev, conf = score_severity(cl.category, "marketing_metric_unverified", ev)
-                    new_disc = _build_discrepancy(
-                        claim=cl,
-                        dtype="marketing_metric_unverified",
-                        severity=sev,
-                        confidence=conf,
-                        why="Transaction volumes should be verified against regulatory filings or audited statements.",
-                        expected="SEC filing with payment volume metrics or press release with audited figures.",
-                        findings=market_findings,
-                        follow_ups=[
-                            "Gather audited payment volume from finance or data team.",
-                            "Escalate marketing claim for revision until figures are confirmed.",
-                        ],
-                    )
-                    _merge_or_add_discrepancy(discrepancies, new_disc)
+            )
 
-            # Check vague claims like "leading", "fastest"
-            vague_words = ["leading", "fastest", "best", "#1", "top", "premier"]
-            if any(word in (cl.claim_text or "").lower() for word in vague_words):
-                ev = confidence_from_findings(market_findings)
-                sev, conf = score_severity(cl.category, "vague_marketing_claim", ev)
-                discrepancies.append(
-                    _build_discrepancy(
-                        claim=cl,
-                        dtype="vague_marketing_claim",
-                        severity=sev,
-                        confidence=conf,
-                        why="Superlative marketing claims ('leading', 'best') are subjective and often unsubstantiated.",
-                        expected="Independent market research, industry report, or specific metric defining 'leading' status.",
-                        findings=market_findings,
-                        follow_ups=[
-                            "Swap subjective superlatives for measurable metrics.",
-                            "Attach third-party research or market share data if claim persists.",
-                        ],
-                    )
+    # Check ISO certifications ("ISO 27001" included)
+    if "ISO" in claim_text:
+        if not adapter_results.has("iso_cert_confirmed"):
+            ev = adapter_results.confidence("trust_center")
+            sev, conf = adapter_results.severity(cl.category, "iso_unverified", ev)
+            discrepancies.append(
+                _build_discrepancy(
+                    claim=cl,
+                    dtype="iso_unverified",
+                    severity=sev,
+                    confidence=conf,
+                    why="ISO certification claims should be verifiable through certificate registries.",
+                    expected="ISO certificate number or listing in certification body database.",
+                    findings=sec_findings,
+                    bundle=adapter_results.bundle("trust_center"),
+                    follow_ups=(
+                        "Collect ISO certificate ID and certification body from security team.",
+                        "Update claim copy with verified scope and coverage.",
+                    ),
                 )
+            )
+
+    # Check PCI DSS claims
+    if "PCI" in claim_text:
+        ev = adapter_results.confidence("trust_center")
+        sev, conf = adapter_results.severity(cl.category, "pci_requires_verification", ev)
+        discrepancies.append(
+            _build_discrepancy(
+                claim=cl,
+                dtype="pci_requires_verification",
+                severity=sev,
+                confidence=conf,
+                why="PCI DSS compliance level should be verified with QSA attestation.",
+                expected="PCI DSS Attestation of Compliance (AOC) or QSA letter with level and date.",
+                findings=sec_findings,
+                bundle=adapter_results.bundle("trust_center"),
+                follow_ups=(
+                    "Request current AOC or QSA attestation letter.",
+                    "Confirm PCI scope with payments ops stakeholder.",
+                ),
+            )
+        )
 
-        # REGULATORY CLAIMS
-        if cl.category == "regulatory":
-            reg_findings = adapter_results.get("cfpb", []) + adapter_results.get("edgar", [])
-
-            # Check SEC registration claims
-            if "SEC" in (cl.claim_text or ""):
-                # Check for confirmed CIK or confirmed company name from real EDGAR adapter
-                sec_filings = [
-                    f
-                    for f in reg_findings
-                    if getattr(f, "key", None) in ["edgar_cik", "edgar_company_name"]
-                ]
-                if not sec_filings or all(
-                    getattr(f, "status", None) != "confirmed" for f in sec_filings
-                ):
-                    ev = confidence_from_findings(reg_findings)
-                    sev, conf = score_severity(cl.category, "regulatory_claim_unverified", ev)
-                    discrepancies.append(
-                        _build_discrepancy(
-                            claim=cl,
-                            dtype="regulatory_claim_unverified",
-                            severity=sev,
-                            confidence=conf,
-                            why="SEC registration can be verified through EDGAR; false claims are serious violations.",
-                            expected="CIK number and EDGAR filing history for RIA, BD, or other registration.",
-                            findings=reg_findings,
-                            follow_ups=[
-                                "Confirm SEC registration status and obtain CIK from legal.",
-                                "Update marketing and disclosures if registration is absent.",
-                            ],
-                        )
-                    )
 
-        # COMPLIANCE CLAIMS
-        if cl.category == "compliance":
-            comp_findings = adapter_results.get("trust_center", []) + adapter_results.get(
-                "edgar", []
+# MARKETING CLAIMS - Flag unverifiable or exaggerated claims
+def _handle_marketing(
+    cl: ExtractedClaim,
+    adapter_results: _FindingPools,
+    discrepancies: List[Discrepancy],
+) -> None:
+    claim_text_lower = (cl.claim_text or "").lower()
+    market_findings = adapter_results["edgar+news+press_metrics"]
+    kind_text = " ".join(filter(None, (cl.claim_kind and cl.claim_kind.lower(), claim_text_lower)))
+
+    # Check customer count claims - only flag if NOT confirmed
+    if _CUSTOMER_TERMS.search(kind_text):
+        if not adapter_results["confirmed:customer"]:
+            ev = adapter_results.confidence("edgar+news+press_metrics")
+            sev, conf = adapter_results.severity(cl.category, "marketing_metric_unverified", ev)
+            new_disc = _build_discrepancy(
+                claim=cl,
+                dtype="marketing_metric_unverified",
+                severity=sev,
+                confidence=conf,
+                why="Customer counts are often marketing puffery; verify against SEC filings or audited reports.",
+                expected="SEC 10-K/10-Q user metrics or audited customer count statement.",
+                findings=market_findings,
+                bundle=adapter_results.bundle("edgar+news+press_metrics"),
+                follow_ups=(
+                    "Request audited customer count from finance or strategy.",
+                    "Replace claim with certified figures before publication.",
+                ),
+            )
+            discrepancies.append(new_disc)
+
+    # Check transaction volume claims - only flag if NOT confirmed
+    if _VOLUME_TERMS.search(kind_text):
+        if not adapter_results["confirmed:volume"]:
+            ev = adapter_results.confidence("edgar+news+press_metrics")
+            sev, conf = adapter_results.severity(cl.category, "marketing_metric_unverified", ev)
+            new_disc = _build_discrepancy(
+                claim=cl,
+                dtype="marketing_metric_unverified",
+                severity=sev,
+                confidence=conf,
+                why="Transaction volumes should be verified against regulatory filings or audited statements.",
+                expected="SEC filing with payment volume metrics or press release with audited figures.",
+                findings=market_findings,
+                bundle=adapter_results.bundle("edgar+news+press_metrics"),
+                follow_ups=(
+                    "Gather audited payment volume from finance or data team.",
+                    "Escalate marketing claim for revision until figures are confirmed.",
+                ),
             )
+            discrepancies.append(new_disc)
+
+    # Check vague claims like "leading", "fastest"
+    if _VAGUE_MARKETING_TERMS.search(claim_text_lower):
+        ev = adapter_results.confidence("edgar+news+press_metrics")
+        sev, conf = adapter_results.severity(cl.category, "vague_marketing_claim", ev)
+        discrepancies.append(
+            _build_discrepancy(
+                claim=cl,
+                dtype="vague_marketing_claim",
+                severity=sev,
+                confidence=conf,
+                why="Superlative marketing claims ('leading', 'best') are subjective and often unsubstantiated.",
+                expected="Independent market research, industry report, or specific metric defining 'leading' status.",
+                findings=market_findings,
+                bundle=adapter_results.bundle("edgar+news+press_metrics"),
+                follow_ups=(
+                    "Swap subjective superlatives for measurable metrics.",
+                    "Attach third-party research or market share data if claim persists.",
+                ),
+            )
+        )
 
-            # Check AML/KYC claims
-            if any(term in (cl.claim_text or "").upper() for term in ["AML", "KYC", "BSA"]):
-                ev = confidence_from_findings(comp_findings)
-                sev, conf = score_severity(cl.category, "compliance_program_mentioned", ev)
-                discrepancies.append(
-                    _build_discrepancy(
-                        claim=cl,
-                        dtype="compliance_program_mentioned",
-                        severity=sev,
-                        confidence=conf,
-                        why="AML/KYC programs should be documented and verifiable; vague mentions are red flags.",
-                        expected="AML policy document, compliance program description, or regulatory examination results.",
-                        findings=comp_findings,
-                        follow_ups=[
-                            "Request AML/KYC policy pack from compliance.",
-                            "Ensure public statements reflect actual program status.",
-                        ],
-                    )
-                )
 
-            # Check GDPR/CCPA claims
-            if any(term in (cl.claim_text or "").upper() for term in ["GDPR", "CCPA"]):
-                ev = confidence_from_findings(comp_findings)
-                sev, conf = score_severity(cl.category, "privacy_compliance_claim", ev)
-                discrepancies.append(
-                    _build_discrepancy(
-                        claim=cl,
-                        dtype="privacy_compliance_claim",
-                        severity=sev,
-                        confidence=conf,
-                        why="Privacy compliance should be documented in privacy policy with specific measures.",
-                        expected="Privacy policy with GDPR/CCPA-specific rights, DPO contact, or privacy certification.",
-                        findings=comp_findings,
-                        follow_ups=[
-                            "Obtain privacy compliance documentation from legal.",
-                            "Clarify public claim with exact scope of GDPR/CCPA coverage.",
-                        ],
-                    )
+# REGULATORY CLAIMS
+def _handle_regulatory(
+    cl: ExtractedClaim,
+    adapter_results: _FindingPools,
+    discrepancies: List[Discrepancy],
+) -> None:
+    claim_text = cl.claim_text or ""
+    reg_findings = adapter_results["cfpb+edgar"]
+
+    # Check SEC registration claims
+    if "SEC" in claim_text:
+        # Check for confirmed CIK or confirmed company name from real EDGAR adapter
+        if not adapter_results.has("sec_identity_confirmed"):
+            ev = adapter_results.confidence("cfpb+edgar")
+            sev, conf = adapter_results.severity(cl.category, "regulatory_claim_unverified", ev)
+            discrepancies.append(
+                _build_discrepancy(
+                    claim=cl,
+                    dtype="regulatory_claim_unverified",
+                    severity=sev,
+                    confidence=conf,
+                    why="SEC registration can be verified through EDGAR; false claims are serious violations.",
+                    expected="CIK number and EDGAR filing history for RIA, BD, or other registration.",
+                    findings=reg_findings,
+                    bundle=adapter_results.bundle("cfpb+edgar"),
+                    follow_ups=(
+                        "Confirm SEC registration status and obtain CIK from legal.",
+                        "Update marketing and disclosures if registration is absent.",
+                    ),
                 )
+            )
 
-        # FINANCIAL PERFORMANCE CLAIMS (for public companies)
-        if cl.category == "financial_performance":
-            edgar_findings = adapter_results.get("edgar_filings", [])
-
-            # Check revenue claims
-            claim_text_lower = (cl.claim_text or "").lower()
-            if any(term in claim_text_lower for term in ["revenue", "sales", "$"]):
-                # Extract numeric value from claim if present
-                claim_value = None
-                if cl.values:
-                    for v in cl.values:
-                        # Try to extract dollar amounts
-                        if "$" in v or "billion" in v.lower() or "million" in v.lower():
-                            claim_value = v
-                            break
-
-                # Check if we have EDGAR revenue data
-                edgar_revenue = None
-                for f in edgar_findings:
-                    if getattr(f, "key", "") == "edgar_revenue_annual":
-                        try:
-                            edgar_revenue = float(getattr(f, "value", "0"))
-                            break
-                        except (ValueError, TypeError):
-                            pass
-
-                if edgar_revenue and claim_value:
-                    # If claim specifies a value, flag for manual review
-                    # (exact matching would require parsing claim values more intelligently)
-                    # Only flag if we have strong evidence (EDGAR data exists) to suggest verification is needed
-                    ev = confidence_from_findings(edgar_findings)
-                    # Use lower severity since we have EDGAR data - this is just a verification reminder
-                    sev, conf = score_severity(cl.category, "revenue_claim_verification_needed", ev)
-                    # Override to lower severity since we're just asking for verification, not flagging a problem
-                    sev = "low" if sev == "med" else sev
-                    discrepancies.append(
-                        _build_discrepancy(
-                            claim=cl,
-                            dtype="revenue_claim_verification_needed",
-                            severity=sev,
-                            confidence=conf,
-                            why="Revenue claims should match SEC filings; verify that website claim aligns with latest filing data.",
-                            expected=f"SEC 10-K/10-Q filing showing revenue figure matching website claim (EDGAR shows ${edgar_revenue:,.0f}).",
-                            findings=edgar_findings,
-                            follow_ups=[
-                                "Verify revenue figure matches latest SEC filing.",
-                                "Update website if claim is outdated or incorrect.",
-                            ],
-                        )
-                    )
-                elif not edgar_revenue and claim_value:
-                    # Revenue claim but no EDGAR data found
-                    ev = confidence_from_findings(edgar_findings)
-                    sev, conf = score_severity(cl.category, "revenue_claim_unverified", ev)
-                    discrepancies.append(
-                        _build_discrepancy(
-                            claim=cl,
-                            dtype="revenue_claim_unverified",
-                            severity=sev,
-                            confidence=conf,
-                            why="Public company revenue claims should be verifiable against SEC filings.",
-                            expected="SEC 10-K/10-Q filing with revenue figures.",
-                            findings=edgar_findings,
-                            follow_ups=[
-                                "Verify company is public and SEC filings are accessible.",
-                                "Ensure revenue claim matches latest SEC filing.",
-                            ],
-                        )
-                    )
 
-            # Check profit/loss claims
-            if any(
-                term in claim_text_lower
-                for term in ["profit", "income", "loss", "profitable", "earnings"]
-            ):
-                edgar_net_income = None
-                for f in edgar_findings:
-                    if getattr(f, "key", "") == "edgar_net_income_annual":
-                        try:
-                            edgar_net_income = float(getattr(f, "value", "0"))
-                            break
-                        except (ValueError, TypeError):
-                            pass
-
-                if edgar_net_income is not None:
-                    # Check if claim contradicts filing (e.g., claims profitable but filing shows loss)
-                    claims_profitable = any(
-                        term in claim_text_lower for term in ["profitable", "profit", "positive"]
-                    )
-                    if claims_profitable and edgar_net_income < 0:
-                        ev = confidence_from_findings(edgar_findings)
-                        sev, conf = score_severity(
-                            cl.category, "profitability_claim_contradicts_filing", ev
-                        )
-                        discrepancies.append(
-                            _build_discrepancy(
-                                claim=cl,
-                                dtype="profitability_claim_contradicts_filing",
-                                severity="high",
-                                confidence=conf,
-                                why="Website claims profitability but SEC filing shows net loss. This is a serious discrepancy.",
-                                expected=f"SEC filing showing net income matching website claim (filing shows ${edgar_net_income:,}).",
-                                findings=edgar_findings,
-                                follow_ups=[
-                                    "Immediately update website to reflect accurate financial status.",
-                                    "Escalate to legal/compliance if claim was intentionally misleading.",
-                                ],
-                            )
-                        )
-
-        # MARKET POSITION CLAIMS (for public companies)
-        if cl.category == "market_position":
-            edgar_findings = adapter_results.get("edgar_filings", [])
-            market_findings = edgar_findings + adapter_results.get("news", [])
-
-            # Check market leadership/superlative claims
-            vague_words = [
-                "leading",
-                "#1",
-                "largest",
-                "fastest",
-                "best",
-                "top",
-                "premier",
-                "dominant",
-            ]
-            if any(word in (cl.claim_text or "").lower() for word in vague_words):
-                ev = confidence_from_findings(market_findings)
-                sev, conf = score_severity(cl.category, "market_position_unsubstantiated", ev)
-                discrepancies.append(
-                    _build_discrepancy(
-                        claim=cl,
-                        dtype="market_position_unsubstantiated",
-                        severity=sev,
-                        confidence=conf,
-                        why="Market position claims should be supported by independent research, market share data, or industry reports.",
-                        expected="Third-party market research, industry analyst report, or quantifiable market share metric.",
-                        findings=market_findings,
-                        follow_ups=[
-                            "Request supporting data from marketing/product team.",
-                            "Replace subjective claims with specific, verifiable metrics.",
-                        ],
-                    )
+# COMPLIANCE CLAIMS
+def _handle_compliance(
+    cl: ExtractedClaim,
+    adapter_results: _FindingPools,
+    discrepancies: List[Discrepancy],
+) -> None:
+    claim_text = cl.claim_text or ""
+    claim_text_upper = claim_text.upper()
+    comp_findings = adapter_results["trust_center+edgar"]
+
+    # Check AML/KYC claims
+    if _AML_TERMS.search(claim_text_upper):
+        ev = adapter_results.confidence("trust_center+edgar")
+        sev, conf = adapter_results.severity(cl.category, "compliance_program_mentioned", ev)
+        discrepancies.append(
+            _build_discrepancy(
+                claim=cl,
+                dtype="compliance_program_mentioned",
+                severity=sev,
+                confidence=conf,
+                why="AML/KYC programs should be documented and verifiable; vague mentions are red flags.",
+                expected="AML policy document, compliance program description, or regulatory examination results.",
+                findings=comp_findings,
+                bundle=adapter_results.bundle("trust_center+edgar"),
+                follow_ups=(
+                    "Request AML/KYC policy pack from compliance.",
+                    "Ensure public statements reflect actual program status.",
+                ),
+            )
+        )
+
+    # Check GDPR/CCPA claims
+    if _PRIVACY_TERMS.search(claim_text_upper):
+        ev = adapter_results.confidence("trust_center+edgar")
+        sev, conf = adapter_results.severity(cl.category, "privacy_compliance_claim", ev)
+        discrepancies.append(
+            _build_discrepancy(
+                claim=cl,
+                dtype="privacy_compliance_claim",
+                severity=sev,
+                confidence=conf,
+                why="Privacy compliance should be documented in privacy policy with specific measures.",
+                expected="Privacy policy with GDPR/CCPA-specific rights, DPO contact, or privacy certification.",
+                findings=comp_findings,
+                bundle=adapter_results.bundle("trust_center+edgar"),
+                follow_ups=(
+                    "Obtain privacy compliance documentation from legal.",
+                    "Clarify public claim with exact scope of GDPR/CCPA coverage.",
+                ),
+            )
+        )
+
+
+# FINANCIAL PERFORMANCE CLAIMS (for public companies)
+def _handle_financial_performance(
+    cl: ExtractedClaim,
+    adapter_results: _FindingPools,
+    discrepancies: List[Discrepancy],
+) -> None:
+    claim_text = cl.claim_text or ""
+    claim_text_lower = claim_text.lower()
+    edgar_findings = adapter_results["edgar_filings"]
+
+    # Check revenue claims
+    if _REVENUE_TERMS.search(claim_text_lower):
+        # Extract numeric value from claim if present
+        claim_value = None
+        if cl.values:
+            for v in cl.values:
+                # Try to extract dollar amounts
+                if "$" in v or _MAGNITUDE_TERMS.search(v.lower()):
+                    claim_value = v
+                    break
+
+        # Check if we have EDGAR revenue data
+        edgar_revenue = None
+        for f in edgar_findings:
+            if f.key == "edgar_revenue_annual":
+                try:
+                    edgar_revenue = float(f.value)
+                    break
+                except (ValueError, TypeError):
+                    pass
+
+        if edgar_revenue and claim_value:
+            # If claim specifies a value, flag for manual review
+            # (exact matching would require parsing claim values more intelligently)
+            # Only flag if we have strong evidence (EDGAR data exists) to suggest verification is needed
+            ev = adapter_results.confidence("edgar_filings")
+            # Use lower severity since we have EDGAR data - this is just a verification reminder
+            sev, conf = adapter_results.severity(
+                cl.category, "revenue_claim_verification_needed", ev
+            )
+            # Override to lower severity since we're just asking for verification, not flagging a problem
+            sev = "low" if sev == "med" else sev
+            discrepancies.append(
+                _build_discrepancy(
+                    claim=cl,
+                    dtype="revenue_claim_verification_needed",
+                    severity=sev,
+                    confidence=conf,
+                    why="Revenue claims should match SEC filings; verify that website claim aligns with latest filing data.",
+                    expected=f"SEC 10-K/10-Q filing showing revenue figure matching website claim (EDGAR shows ${edgar_revenue:,.0f}).",
+                    findings=edgar_findings,
+                    bundle=adapter_results.bundle("edgar_filings"),
+                    follow_ups=(
+                        "Verify revenue figure matches latest SEC filing.",
+                        "Update website if claim is outdated or incorrect.",
+                    ),
+                )
+            )
+        elif not edgar_revenue and claim_value:
+            # Revenue claim but no EDGAR data found
+            ev = adapter_results.confidence("edgar_filings")
+            sev, conf = adapter_results.severity(cl.category, "revenue_claim_unverified", ev)
+            discrepancies.append(
+                _build_discrepancy(
+                    claim=cl,
+                    dtype="revenue_claim_unverified",
+                    severity=sev,
+                    confidence=conf,
+                    why="Public company revenue claims should be verifiable against SEC filings.",
+                    expected="SEC 10-K/10-Q filing with revenue figures.",
+                    findings=edgar_findings,
+                    bundle=adapter_results.bundle("edgar_filings"),
+                    follow_ups=(
+                        "Verify company is public and SEC filings are accessible.",
+                        "Ensure revenue claim matches latest SEC filing.",
+                    ),
                 )
+            )
 
-            # Check market share claims with specific percentages
-            if "%" in (cl.claim_text or "") and any(
-                term in (cl.claim_text or "").lower() for term in ["market share", "share"]
-            ):
-                ev = confidence_from_findings(market_findings)
-                sev, conf = score_severity(
-                    cl.category, "market_share_claim_verification_needed", ev
+    # Check profit/loss claims (only a filed net income can contradict them)
+    if edgar_findings and _PROFIT_TERMS.search(claim_text_lower):
+        edgar_net_income = None
+        for f in edgar_findings:
+            if f.key == "edgar_net_income_annual":
+                try:
+                    edgar_net_income = float(f.value)
+                    break
+                except (ValueError, TypeError):
+                    pass
+
+        if edgar_net_income is not None:
+            # Check if claim contradicts filing (e.g., claims profitable but filing shows loss)
+            claims_profitable = _PROFITABLE_TERMS.search(claim_text_lower) is not None
+            if claims_profitable and edgar_net_income < 0:
+                ev = adapter_results.confidence("edgar_filings")
+                sev, conf = adapter_results.severity(
+                    cl.category, "profitability_claim_contradicts_filing", ev
                 )
                 discrepancies.append(
                     _build_discrepancy(
                         claim=cl,
-                        dtype="market_share_claim_verification_needed",
-                        severity=sev,
+                        dtype="profitability_claim_contradicts_filing",
+                        severity="high",
                         confidence=conf,
-                        why="Market share percentages should be verifiable through industry reports or financial filings.",
-                        expected="Market research report or industry analysis supporting the market share claim.",
-                        findings=market_findings,
-                        follow_ups=[
-                            "Obtain source documentation for market share figure.",
-                            "Ensure claim includes attribution to research source.",
-                        ],
+                        why="Website claims profitability but SEC filing shows net loss. This is a serious discrepancy.",
+                        expected=f"SEC filing showing net income matching website claim (filing shows ${edgar_net_income:,}).",
+                        findings=edgar_findings,
+                        bundle=adapter_results.bundle("edgar_filings"),
+                        follow_ups=(
+                            "Immediately update website to reflect accurate financial status.",
+                            "Escalate to legal/compliance if claim was intentionally misleading.",
+                        ),
                     )
                 )
 
-        # FORWARD-LOOKING STATEMENTS (for public companies)
-        if cl.category == "forward_looking":
-            edgar_findings = adapter_results.get("edgar_filings", [])
-
-            # Check if forward-looking statements have proper disclaimers
-            forward_looking_keywords = [
-                "expect",
-                "believe",
-                "anticipate",
-                "plan",
-                "forecast",
-                "project",
-                "guidance",
-                "target",
-            ]
-            has_disclaimer = any(
-                term in (cl.claim_text or "").lower()
-                for term in ["forward-looking", "cautionary", "safe harbor", "risks"]
+
+# MARKET POSITION CLAIMS (for public companies)
+def _handle_market_position(
+    cl: ExtractedClaim,
+    adapter_results: _FindingPools,
+    discrepancies: List[Discrepancy],
+) -> None:
+    claim_text = cl.claim_text or ""
+    claim_text_lower = claim_text.lower()
+    market_findings = adapter_results["edgar_filings+news"]
+
+    # Check market leadership/superlative claims
+    if _VAGUE_POSITION_TERMS.search(claim_text_lower):
+        ev = adapter_results.confidence("edgar_filings+news")
+        sev, conf = adapter_results.severity(cl.category, "market_position_unsubstantiated", ev)
+        discrepancies.append(
+            _build_discrepancy(
+                claim=cl,
+                dtype="market_position_unsubstantiated",
+                severity=sev,
+                confidence=conf,
+                why="Market position claims should be supported by independent research, market share data, or industry reports.",
+                expected="Third-party market research, industry analyst report, or quantifiable market share metric.",
+                findings=market_findings,
+                bundle=adapter_results.bundle("edgar_filings+news"),
+                follow_ups=(
+                    "Request supporting data from marketing/product team.",
+                    "Replace subjective claims with specific, verifiable metrics.",
+                ),
             )
+        )
 
-            if (
-                any(kw in (cl.claim_text or "").lower() for kw in forward_looking_keywords)
-                and not has_disclaimer
-            ):
-                ev = confidence_from_findings(edgar_findings)
-                sev, conf = score_severity(cl.category, "forward_looking_missing_disclaimer", ev)
-                discrepancies.append(
-                    _build_discrepancy(
-                        claim=cl,
-                        dtype="forward_looking_missing_disclaimer",
-                        severity=sev,
-                        confidence=conf,
-                        why="Forward-looking statements should include safe harbor disclaimers to protect against liability.",
-                        expected="Forward-looking statement with appropriate safe harbor language and risk disclaimers.",
-                        findings=edgar_findings,
-                        follow_ups=[
-                            "Add safe harbor disclaimer to forward-looking statements.",
-                            "Review with legal team to ensure compliance with SEC guidance.",
-                        ],
-                    )
+    # Check market share claims with specific percentages
+    if "%" in claim_text and "share" in claim_text_lower:
+        ev = adapter_results.confidence("edgar_filings+news")
+        sev, conf = adapter_results.severity(
+            cl.category, "market_share_claim_verification_needed", ev
+        )
+        discrepancies.append(
+            _build_discrepancy(
+                claim=cl,
+                dtype="market_share_claim_verification_needed",
+                severity=sev,
+                confidence=conf,
+                why="Market share percentages should be verifiable through industry reports or financial filings.",
+                expected="Market research report or industry analysis supporting the market share claim.",
+                findings=market_findings,
+                bundle=adapter_results.bundle("edgar_filings+news"),
+                follow_ups=(
+                    "Obtain source documentation for market share figure.",
+                    "Ensure claim includes attribution to research source.",
+                ),
+            )
+        )
+
+
+# FORWARD-LOOKING STATEMENTS (for public companies)
+def _handle_forward_looking(
+    cl: ExtractedClaim,
+    adapter_results: _FindingPools,
+    discrepancies: List[Discrepancy],
+) -> None:
+    claim_text = cl.claim_text or ""
+    claim_text_lower = claim_text.lower()
+    edgar_findings = adapter_results["edgar_filings"]
+    earnings_findings = adapter_results["earnings_calls"]
+    has_transcript = bool(earnings_findings) and adapter_results.has("earnings_transcript")
+
+    # Check if forward-looking statements have proper disclaimers
+    # Both this check and the earnings-call check below key off the same keyword scan, which
+    # is skipped when the short disclaimer scan matches and no transcript needs it.
+    has_disclaimer = _DISCLAIMER_TERMS.search(claim_text_lower) is not None
+    is_forward_looking = (not has_disclaimer or has_transcript) and (
+        _FORWARD_LOOKING_TERMS.search(claim_text_lower) is not None
+    )
+
+    if is_forward_looking and not has_disclaimer:
+        ev = adapter_results.confidence("edgar_filings")
+        sev, conf = adapter_results.severity(cl.category, "forward_looking_missing_disclaimer", ev)
+        discrepancies.append(
+            _build_discrepancy(
+                claim=cl,
+                dtype="forward_looking_missing_disclaimer",
+                severity=sev,
+                confidence=conf,
+                why="Forward-looking statements should include safe harbor disclaimers to protect against liability.",
+                expected="Forward-looking statement with appropriate safe harbor language and risk disclaimers.",
+                findings=edgar_findings,
+                bundle=adapter_results.bundle("edgar_filings"),
+                follow_ups=(
+                    "Add safe harbor disclaimer to forward-looking statements.",
+                    "Review with legal team to ensure compliance with SEC guidance.",
+                ),
+            )
+        )
+
+    # Check guidance claims - flag for verification that it matches SEC filings
+    # Note: We can't easily parse filing content to verify exact match, so we flag for manual review
+    if "guidance" in claim_text_lower and _GUIDANCE_TERMS.search(claim_text_lower):
+        # Check if we have recent filings available
+        if adapter_results.has("recent_filings"):
+            ev = adapter_results.confidence("edgar_filings")
+            sev, conf = adapter_results.severity(cl.category, "guidance_verification_needed", ev)
+            discrepancies.append(
+                _build_discrepancy(
+                    claim=cl,
+                    dtype="guidance_verification_needed",
+                    severity=sev,
+                    confidence=conf,
+                    why="Financial guidance on website should match what's disclosed in SEC filings to avoid confusion.",
+                    expected="Verification that website guidance matches latest 8-K or 10-Q/10-K guidance disclosure.",
+                    findings=edgar_findings,
+                    bundle=adapter_results.bundle("edgar_filings"),
+                    follow_ups=(
+                        "Verify guidance matches what's disclosed in SEC filings.",
+                        "Ensure website guidance is synchronized with investor communications.",
+                    ),
                 )
+            )
 
-            # Check guidance claims - flag for verification that it matches SEC filings
-            # Note: We can't easily parse filing content to verify exact match, so we flag for manual review
-            if "guidance" in (cl.claim_text or "").lower() and any(
-                term in (cl.claim_text or "").lower()
-                for term in ["$", "revenue", "earnings", "forecast"]
-            ):
-                # Check if we have recent filings available
-                has_recent_filings = any(
-                    "edgar_8k" in (getattr(f, "key", "") or "")
-                    or "edgar_latest_10q" in (getattr(f, "key", "") or "")
-                    or "edgar_latest_10k" in (getattr(f, "key", "") or "")
-                    for f in edgar_findings
+    # EARNINGS CALLS RECONCILIATION (Phase 3)
+    # Check if forward-looking statements match earnings call transcripts
+    if has_transcript:
+        # Forward-looking statements should align with earnings call guidance
+        if is_forward_looking:
+            ev = adapter_results.confidence("earnings_calls")
+            sev, conf = adapter_results.severity(
+                cl.category, "forward_looking_earnings_verification_needed", ev
+            )
+            discrepancies.append(
+                _build_discrepancy(
+                    claim=cl,
+                    dtype="forward_looking_earnings_verification_needed",
+                    severity=sev,
+                    confidence=conf,
+                    why="Forward-looking statements on website should align with what was disclosed in earnings call transcripts.",
+                    expected="Verification that website forward-looking statement matches guidance provided in earnings call.",
+                    findings=earnings_findings,
+                    bundle=adapter_results.bundle("earnings_calls"),
+                    follow_ups=(
+                        "Review earnings call transcripts to verify forward-looking statement alignment.",
+                        "Ensure website claims match what executives stated in earnings calls.",
+                    ),
                 )
-                if has_recent_filings:
-                    ev = confidence_from_findings(edgar_findings)
-                    sev, conf = score_severity(cl.category, "guidance_verification_needed", ev)
-                    discrepancies.append(
-                        _build_discrepancy(
-                            claim=cl,
-                            dtype="guidance_verification_needed",
-                            severity=sev,
-                            confidence=conf,
-                            why="Financial guidance on website should match what's disclosed in SEC filings to avoid confusion.",
-                            expected="Verification that website guidance matches latest 8-K or 10-Q/10-K guidance disclosure.",
-                            findings=edgar_findings,
-                            follow_ups=[
-                                "Verify guidance matches what's disclosed in SEC filings.",
-                                "Ensure website guidance is synchronized with investor communications.",
-                            ],
-                        )
-                    )
+            )
 
-        # LITIGATION CLAIMS (for public companies)
-        if cl.category == "litigation":
-            edgar_findings = adapter_results.get("edgar_filings", [])
-
-            # Check if litigation is mentioned on website
-            litigation_keywords = [
-                "lawsuit",
-                "litigation",
-                "legal action",
-                "sued",
-                "complaint",
-                "dispute",
-                "settlement",
-            ]
-            if any(kw in (cl.claim_text or "").lower() for kw in litigation_keywords):
-                # Check if Item 3 (Legal Proceedings) section exists in 10-K
-                has_item_3 = any(
-                    getattr(f, "key", "") == "edgar_10k_item_3_legal" for f in edgar_findings
+
+# LITIGATION CLAIMS (for public companies)
+def _handle_litigation(
+    cl: ExtractedClaim,
+    adapter_results: _FindingPools,
+    discrepancies: List[Discrepancy],
+) -> None:
+    claim_text = cl.claim_text or ""
+    claim_text_lower = claim_text.lower()
+    edgar_findings = adapter_results["edgar_filings"]
+
+    # Check if litigation is mentioned on website
+    if _LITIGATION_TERMS.search(claim_text_lower):
+        # Check if Item 3 (Legal Proceedings) section exists in 10-K
+        if adapter_results.has("item_3_legal"):
+            ev = adapter_results.confidence("edgar_filings")
+            sev, conf = adapter_results.severity(
+                cl.category, "litigation_disclosure_verification_needed", ev
+            )
+            discrepancies.append(
+                _build_discrepancy(
+                    claim=cl,
+                    dtype="litigation_disclosure_verification_needed",
+                    severity=sev,
+                    confidence=conf,
+                    why="Litigation mentioned on website should match disclosures in SEC filings (Item 3 of 10-K).",
+                    expected="10-K Item 3 (Legal Proceedings) section confirming or describing the litigation.",
+                    findings=edgar_findings,
+                    bundle=adapter_results.bundle("edgar_filings"),
+                    follow_ups=(
+                        "Verify litigation claim matches 10-K Item 3 disclosure.",
+                        "Ensure website statements don't contradict SEC filings.",
+                    ),
                 )
+            )
+        else:
+            ev = adapter_results.confidence("edgar_filings")
+            sev, conf = adapter_results.severity(cl.category, "litigation_claim_missing_filing", ev)
+            discrepancies.append(
+                _build_discrepancy(
+                    claim=cl,
+                    dtype="litigation_claim_missing_filing",
+                    severity="high",
+                    confidence=conf,
+                    why="Public companies must disclose material litigation in SEC filings. Website mention without filing disclosure may indicate incomplete disclosure.",
+                    expected="10-K Item 3 (Legal Proceedings) section or 8-K filing disclosing the litigation.",
+                    findings=edgar_findings,
+                    bundle=adapter_results.bundle("edgar_filings"),
+                    follow_ups=(
+                        "Verify litigation is properly disclosed in SEC filings.",
+                        "Escalate to legal/compliance if material litigation is missing from filings.",
+                    ),
+                )
+            )
 
-                if has_item_3:
-                    ev = confidence_from_findings(edgar_findings)
-                    sev, conf = score_severity(
-                        cl.category, "litigation_disclosure_verification_needed", ev
-                    )
-                    discrepancies.append(
-                        _build_discrepancy(
-                            claim=cl,
-                            dtype="litigation_disclosure_verification_needed",
-                            severity=sev,
-                            confidence=conf,
-                            why="Litigation mentioned on website should match disclosures in SEC filings (Item 3 of 10-K).",
-                            expected="10-K Item 3 (Legal Proceedings) section confirming or describing the litigation.",
-                            findings=edgar_findings,
-                            follow_ups=[
-                                "Verify litigation claim matches 10-K Item 3 disclosure.",
-                                "Ensure website statements don't contradict SEC filings.",
-                            ],
-                        )
-                    )
-                else:
-                    ev = confidence_from_findings(edgar_findings)
-                    sev, conf = score_severity(cl.category, "litigation_claim_missing_filing", ev)
-                    discrepancies.append(
-                        _build_discrepancy(
-                            claim=cl,
-                            dtype="litigation_claim_missing_filing",
-                            severity="high",
-                            confidence=conf,
-                            why="Public companies must disclose material litigation in SEC filings. Website mention without filing disclosure may indicate incomplete disclosure.",
-                            expected="10-K Item 3 (Legal Proceedings) section or 8-K filing disclosing the litigation.",
-                            findings=edgar_findings,
-                            follow_ups=[
-                                "Verify litigation is properly disclosed in SEC filings.",
-                                "Escalate to legal/compliance if material litigation is missing from filings.",
-                            ],
-                        )
-                    )
 
-        # BUSINESS METRICS CLAIMS (for public companies)
-        if cl.category == "business_metrics":
-            edgar_findings = adapter_results.get("edgar_filings", [])
-            market_findings = edgar_findings + adapter_results.get("press_metrics", [])
-
-            # Check user/customer count claims
-            claim_text_lower = (cl.claim_text or "").lower()
-            if any(
-                term in claim_text_lower for term in ["user", "customer", "merchant", "account"]
-            ):
-                has_confirmed = _has_confirmed_metric(
-                    market_findings, ["user", "customer", "merchant", "account"]
+# BUSINESS METRICS CLAIMS (for public companies)
+def _handle_business_metrics(
+    cl: ExtractedClaim,
+    adapter_results: _FindingPools,
+    discrepancies: List[Discrepancy],
+) -> None:
+    claim_text = cl.claim_text or ""
+    claim_text_lower = claim_text.lower()
+    market_findings = adapter_results["edgar_filings+press_metrics"]
+
+    # Check user/customer count claims
+    if _ACCOUNT_TERMS.search(claim_text_lower):
+        if not adapter_results["confirmed:account"]:
+            ev = adapter_results.confidence("edgar_filings+press_metrics")
+            sev, conf = adapter_results.severity(cl.category, "business_metric_unverified", ev)
+            discrepancies.append(
+                _build_discrepancy(
+                    claim=cl,
+                    dtype="business_metric_unverified",
+                    severity=sev,
+                    confidence=conf,
+                    why="Business metrics should be verifiable through SEC filings, press releases, or audited statements.",
+                    expected="SEC filing (10-K/10-Q) or verified press release with user/customer metrics.",
+                    findings=market_findings,
+                    bundle=adapter_results.bundle("edgar_filings+press_metrics"),
+                    follow_ups=(
+                        "Request verified user/customer count from finance or product team.",
+                        "Ensure claim matches what's disclosed in SEC filings or official communications.",
+                    ),
                 )
-                if not has_confirmed:
-                    ev = confidence_from_findings(market_findings)
-                    sev, conf = score_severity(cl.category, "business_metric_unverified", ev)
-                    discrepancies.append(
-                        _build_discrepancy(
-                            claim=cl,
-                            dtype="business_metric_unverified",
-                            severity=sev,
-                            confidence=conf,
-                            why="Business metrics should be verifiable through SEC filings, press releases, or audited statements.",
-                            expected="SEC filing (10-K/10-Q) or verified press release with user/customer metrics.",
-                            findings=market_findings,
-                            follow_ups=[
-                                "Request verified user/customer count from finance or product team.",
-                                "Ensure claim matches what's disclosed in SEC filings or official communications.",
-                            ],
-                        )
-                    )
+            )
+
 
-        # MATERIAL EVENTS CLAIMS (for public companies)
-        if cl.category == "material_events":
-            edgar_findings = adapter_results.get("edgar_filings", [])
-            press_release_findings = adapter_results.get("press_releases", [])
-
-            # Check for M&A, partnerships, executive changes
-            material_keywords = [
-                "acquired",
-                "merger",
-                "partnership",
-                "ceo",
-                "executive",
-                "leadership",
-                "agreement",
-            ]
-            if any(kw in (cl.claim_text or "").lower() for kw in material_keywords):
-                # Check if there's a recent 8-K filing
-                # Note: We check last 5 8-K filings; if event is older, this may not catch it
-                # but material events should be filed within 4 business days per SEC rules
-                has_recent_8k = any(
-                    "edgar_8k" in (getattr(f, "key", "") or "") for f in edgar_findings
+# MATERIAL EVENTS CLAIMS (for public companies)
+def _handle_material_events(
+    cl: ExtractedClaim,
+    adapter_results: _FindingPools,
+    discrepancies: List[Discrepancy],
+) -> None:
+    claim_text = cl.claim_text or ""
+    claim_text_lower = claim_text.lower()
+    filed_findings = adapter_results["edgar_filings+press_releases"]
+
+    # Check for M&A, partnerships, executive changes
+    if _MATERIAL_EVENT_TERMS.search(claim_text_lower):
+        # Check if there's a recent 8-K filing
+        # Note: We check last 5 8-K filings; if event is older, this may not catch it
+        # but material events should be filed within 4 business days per SEC rules
+        has_recent_8k = adapter_results.has("recent_8k")
+
+        # Also check press releases
+        has_press_release = adapter_results.has("press_release_confirmed")
+
+        if not has_recent_8k and not has_press_release:
+            ev = adapter_results.confidence("edgar_filings+press_releases")
+            sev, conf = adapter_results.severity(cl.category, "material_event_missing_8k", ev)
+            # Material events without 8-K filings are high severity compliance issues
+            discrepancies.append(
+                _build_discrepancy(
+                    claim=cl,
+                    dtype="material_event_missing_8k",
+                    severity="high",
+                    confidence=conf,
+                    why="Material events (M&A, executive changes, partnerships) typically require 8-K filings within 4 business days per SEC rules.",
+                    expected="8-K filing or press release disclosing the material event within required timeframe.",
+                    findings=filed_findings,
+                    bundle=adapter_results.bundle("edgar_filings+press_releases"),
+                    follow_ups=(
+                        "Verify material event is properly disclosed in 8-K filing or press release.",
+                        "Check if event occurred recently enough that 8-K should already be filed.",
+                        "Escalate to legal/compliance if required 8-K filing is missing.",
+                    ),
                 )
+            )
+
 
-                # Also check press releases
-                has_press_release = any(
-                    "press_release" in (getattr(f, "key", "") or "")
-                    and getattr(f, "status", "") == "confirmed"
-                    for f in press_release_findings
+# PRESS RELEASE RECONCILIATION (Phase 3)
+# Compare website claims against official press releases
+# Note: This is a simplified check - full implementation would parse press release content
+# For now, we only flag material events since those are most likely to have press releases
+def _handle_material_event_press_release(
+    cl: ExtractedClaim,
+    adapter_results: _FindingPools,
+    discrepancies: List[Discrepancy],
+) -> None:
+    press_release_findings = adapter_results["press_releases"]
+    if press_release_findings:
+        # Material events should have corresponding press releases
+        # Check if we found press releases in recent filings
+        if not adapter_results.has("press_release_confirmed"):
+            # Material event claim but no recent press release found
+            ev = adapter_results.confidence("press_releases")
+            sev, conf = adapter_results.severity(
+                cl.category, "material_event_press_release_verification_needed", ev
+            )
+            # Lower severity since press releases may exist elsewhere
+            sev = "low"
+            discrepancies.append(
+                _build_discrepancy(
+                    claim=cl,
+                    dtype="material_event_press_release_verification_needed",
+                    severity=sev,
+                    confidence=conf,
+                    why="Material events typically have corresponding press releases or official announcements.",
+                    expected="Press release or official announcement confirming the material event.",
+                    findings=press_release_findings,
+                    bundle=adapter_results.bundle("press_releases"),
+                    follow_ups=(
+                        "Verify material event was announced via press release or official channel.",
+                        "Ensure website claims are consistent with official communications.",
+                    ),
                 )
+            )
 
-                if not has_recent_8k and not has_press_release:
-                    ev = confidence_from_findings(edgar_findings + press_release_findings)
-                    sev, conf = score_severity(cl.category, "material_event_missing_8k", ev)
-                    # Material events without 8-K filings are high severity compliance issues
-                    discrepancies.append(
-                        _build_discrepancy(
-                            claim=cl,
-                            dtype="material_event_missing_8k",
-                            severity="high",
-                            confidence=conf,
-                            why="Material events (M&A, executive changes, partnerships) typically require 8-K filings within 4 business days per SEC rules.",
-                            expected="8-K filing or press release disclosing the material event within required timeframe.",
-                            findings=edgar_findings + press_release_findings,
-                            follow_ups=[
-                                "Verify material event is properly disclosed in 8-K filing or press release.",
-                                "Check if event occurred recently enough that 8-K should already be filed.",
-                                "Escalate to legal/compliance if required 8-K filing is missing.",
-                            ],
-                        )
-                    )
 
-        # EARNINGS CALLS RECONCILIATION (Phase 3)
-        # Check if forward-looking statements match earnings call transcripts
-        if cl.category == "forward_looking":
-            earnings_findings = adapter_results.get("earnings_calls", [])
+# Handlers run in order; each category's checks are independent of one another.
+_HANDLERS: dict[str, tuple[Handler, ...]] = {
+    "licensing": (_handle_licensing,),
+    "partner_bank": (_handle_partner_bank,),
+    "security": (_handle_security,),
+    "marketing": (_handle_marketing,),
+    "regulatory": (_handle_regulatory,),
+    "compliance": (_handle_compliance,),
+    "financial_performance": (_handle_financial_performance,),
+    "market_position": (_handle_market_position,),
+    "forward_looking": (_handle_forward_looking,),
+    "litigation": (_handle_litigation,),
+    "business_metrics": (_handle_business_metrics,),
+    "material_events": (_handle_material_events, _handle_material_event_press_release),
+}
+
+
+def _process_claim(cl: ExtractedClaim, pooled: _FindingPools) -> List[Discrepancy]:
+    """Run the claim's category handlers; depends only on the claim and the pooled findings."""
+    found: List[Discrepancy] = []
+    for handler in _HANDLERS.get(cl.category, ()):
+        handler(cl, pooled, found)
+    return found
+
+
+def reconcile(
+    claims: ClaimSet, adapter_results: dict[str, list], now: datetime | None = None
+) -> TruthCard:
+    """
+    Reconcile extracted claims against verification sources.
 
-            # Check if earnings transcripts are available
-            has_transcripts = any(
-                "earnings_transcript" in (getattr(f, "key", "") or "")
-                and getattr(f, "status", "") == "confirmed"
-                for f in earnings_findings
-            )
+    This engine checks claims against multiple adapters and flags discrepancies:
+    - Licensing claims vs NMLS/FINTRAC/EDGAR data
+    - Partner bank claims vs public disclosures
+    - Security certifications vs trust centers
+    - Marketing metrics vs regulatory filings
 
-            if has_transcripts:
-                # Forward-looking statements should align with earnings call guidance
-                forward_looking_keywords = [
-                    "expect",
-                    "believe",
-                    "anticipate",
-                    "plan",
-                    "forecast",
-                    "project",
-                    "guidance",
-                    "target",
-                ]
-                if any(kw in (cl.claim_text or "").lower() for kw in forward_looking_keywords):
-                    ev = confidence_from_findings(earnings_findings)
-                    sev, conf = score_severity(
-                        cl.category, "forward_looking_earnings_verification_needed", ev
-                    )
-                    discrepancies.append(
-                        _build_discrepancy(
-                            claim=cl,
-                            dtype="forward_looking_earnings_verification_needed",
-                            severity=sev,
-                            confidence=conf,
-                            why="Forward-looking statements on website should align with what was disclosed in earnings call transcripts.",
-                            expected="Verification that website forward-looking statement matches guidance provided in earnings call.",
-                            findings=earnings_findings,
-                            follow_ups=[
-                                "Review earnings call transcripts to verify forward-looking statement alignment.",
-                                "Ensure website claims match what executives stated in earnings calls.",
-                            ],
-                        )
-                    )
+    `now` stamps the card's generated_at; batch callers can pass one shared timestamp.
+    """
+    discrepancies: List[Discrepancy] = []
+    pooled = _pool_findings(adapter_results)
 
-        # PRESS RELEASE RECONCILIATION (Phase 3)
-        # Compare website claims against official press releases
-        # Note: This is a simplified check - full implementation would parse press release content
-        # For now, we only flag material events since those are most likely to have press releases
-        press_release_findings = adapter_results.get("press_releases", [])
-
-        if cl.category == "material_events" and press_release_findings:
-            # Material events should have corresponding press releases
-            # Check if we found press releases in recent filings
-            has_recent_pr = any(
-                "press_release" in (getattr(f, "key", "") or "")
-                and getattr(f, "status", "") == "confirmed"
-                for f in press_release_findings
-            )
+    logger.debug("Reconciling %d claims", len(claims.claims))
 
-            if not has_recent_pr:
-                # Material event claim but no recent press release found
-                ev = confidence_from_findings(press_release_findings)
-                sev, conf = score_severity(
-                    cl.category, "material_event_press_release_verification_needed", ev
-                )
-                # Lower severity since press releases may exist elsewhere
-                sev = "low"
-                discrepancies.append(
-                    _build_discrepancy(
-                        claim=cl,
-                        dtype="material_event_press_release_verification_needed",
-                        severity=sev,
-                        confidence=conf,
-                        why="Material events typically have corresponding press releases or official announcements.",
-                        expected="Press release or official announcement confirming the material event.",
-                        findings=press_release_findings,
-                        follow_ups=[
-                            "Verify material event was announced via press release or official channel.",
-                            "Ensure website claims are consistent with official communications.",
-                        ],
-                    )
-                )
+    debug = logger.isEnabledFor(logging.DEBUG)
+    for cl in claims.claims:
+        if debug:
+            logger.debug("Checking claim: [%s] %.60s", cl.category, cl.claim_text)
+        discrepancies.extend(_process_claim(cl, pooled))
+    # Merging is the only cross-claim step, so it runs once over everything the handlers raised.
+    discrepancies = _merge_duplicates(discrepancies)
 
     # HISTORICAL TRACKING RECONCILIATION (Phase 3)
     # Flag claims that changed significantly from previous extractions (once per analysis)
     historical_findings = adapter_results.get("historical_tracking", [])
 
     if historical_findings:
-        # Check if there are modified or removed claims
-        has_modified = any(
-            "historical_modified_claims" in (getattr(f, "key", "") or "")
-            for f in historical_findings
-        )
-        has_removed = any(
-            "historical_removed_claims" in (getattr(f, "key", "") or "")
-            for f in historical_findings
+        # Check if there are modified or removed claims (one pass, stops at the first hit)
+        has_changes = any(
+            f.key.startswith(_HISTORICAL_CHANGE_PREFIXES) for f in historical_findings
         )
 
-        if has_modified or has_removed:
+        if has_changes:
             # Add a single informational discrepancy about historical changes
             ev = confidence_from_findings(historical_findings)
             sev, conf = score_severity("marketing", "historical_claims_changed", ev)
@@ -950,15 +1187,13 @@ def reconcile(claims: ClaimSet, adapter_results: dict[str, list]) -> TruthCard:
                     why="Claims have changed compared to previous extraction. Verify if changes are intentional and accurate.",
                     expected="Review of historical claim changes to ensure accuracy.",
                     findings=historical_findings,
-                    follow_ups=[
+                    follow_ups=(
                         "Review claim changes in historical tracking.",
                         "Verify that claim changes are intentional and accurate.",
-                    ],
+                    ),
                 )
             )
-    sev_counts = {"high": 0, "med": 0, "low": 0}
-    for d in discrepancies:
-        sev_counts[d.severity] += 1
+    sev_counts = Counter(d.severity for d in discrepancies)
     severity_summary = f"H:{sev_counts['high']} • M:{sev_counts['med']} • L:{sev_counts['low']}"
     overall_confidence = min(1.0, 0.5 + 0.1 * len(discrepancies))
     return TruthCard(
@@ -967,5 +1202,5 @@ def reconcile(claims: ClaimSet, adapter_results: dict[str, list]) -> TruthCard:
         severity_summary=severity_summary,
         discrepancies=discrepancies,
         overall_confidence=overall_confidence,
-        generated_at=datetime.now(UTC),
+        generated_at=now or datetime.now(UTC),
     )
@@ -1,6 +1,7 @@
 import asyncio
 import json
 import time
+from contextlib import asynccontextmanager
 from typing import Optional
 
 from fastapi import FastAPI, Form, HTTPException, Query, Request
@@ -11,9 +12,22 @@ from pydantic import BaseModel
 from .alerts.monitor import AlertManager
 from .alerts.notifications import send_alert
 from .cli import _verify
+from .config import settings
 from .export.pdf import generate_pdf
+from .ingestion.fetch import aclose_browser, aclose_client
+from .logging import setup_logging
 
-app = FastAPI(title="Iva Truth Meter")
+setup_logging(settings.log_level)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    await aclose_client()
+    await aclose_browser()
+
+
+app = FastAPI(title="Iva Truth Meter", lifespan=lifespan)
 templates = Jinja2Templates(directory="src/iva/web/templates")
 
 
@@ -82,6 +82,40 @@ def test_alert_manager_acknowledge():
             monitor_module.ALERTS_DATA_DIR = original_dir
 
 
+def test_alert_manager_load_limit_returns_most_recent():
+    """Test that load_alerts returns the newest alerts first, capped at limit."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        import src.iva.alerts.monitor as monitor_module
+
+        original_dir = monitor_module.ALERTS_DATA_DIR
+        monitor_module.ALERTS_DATA_DIR = Path(tmpdir) / "data" / "alerts"
+        monitor_module.ALERTS_DATA_DIR.mkdir(parents=True, exist_ok=True)
+
+        try:
+            manager = AlertManager()
+            for day in (3, 1, 5, 2, 4):
+                manager.save_alert(
+                    Alert(
+                        id=f"alert_{day}",
+                        company="Test Company",
+                        alert_type=AlertType.SEVERITY_INCREASE,
+                        severity=AlertSeverity.MEDIUM,
+                        message=f"Alert {day}",
+                        details={},
+                        generated_at=datetime(2025, 1, day, tzinfo=UTC),
+                    )
+                )
+
+            loaded = manager.load_alerts("Test Company", limit=3)
+
+            assert [a.id for a in loaded] == ["alert_5", "alert_4", "alert_3"]
+            assert loaded[0].alert_type == AlertType.SEVERITY_INCREASE
+            assert loaded[0].severity == AlertSeverity.MEDIUM
+            assert manager.load_alerts("Unknown Company") == []
+        finally:
+            monitor_module.ALERTS_DATA_DIR = original_dir
+
+
 def test_alert_manager_process_truth_card():
     """Test processing truth card to generate alerts."""
     with tempfile.TemporaryDirectory() as tmpdir:
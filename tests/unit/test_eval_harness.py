@@ -0,0 +1,32 @@
+"""Tests for the evaluation harness."""
+
+from src.iva.eval.harness import evaluate
+
+
+def _card(url: str) -> dict:
+    return {
+        "url": url,
+        "company": "Acme",
+        "severity_summary": "H:0 • M:0 • L:0",
+        "discrepancies": [],
+        "overall_confidence": 0.5,
+    }
+
+
+def test_evaluate_reindexes_golden_list_mutated_in_place():
+    """A golden list edited between evaluations is never served a stale index."""
+    golden = [{"url": "https://a.example", "expected_truth_card": {}}]
+    assert not evaluate([_card("https://a.example")], golden).failures
+
+    golden[0] = {"url": "https://b.example", "expected_truth_card": {}}
+    assert not evaluate([_card("https://b.example")], golden).failures
+    assert evaluate([_card("https://a.example")], golden).failures == [
+        "https://a.example missing from golden dataset"
+    ]
+
+
+def test_evaluate_golden_tuple():
+    """The immutable tuple form (as returned by load_golden) evaluates the same way."""
+    golden = ({"url": "https://a.example", "expected_truth_card": {}},)
+    assert not evaluate([_card("https://a.example")], golden).failures
+    assert not evaluate([_card("https://a.example")], golden).failures
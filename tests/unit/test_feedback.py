@@ -0,0 +1,54 @@
+"""Tests for the analyst feedback log."""
+
+import pytest
+
+from src.iva.learning import feedback as feedback_module
+from src.iva.learning.feedback import (
+    AnalystAction,
+    FeedbackEntry,
+    FeedbackLogger,
+    compute_rule_adjustments,
+    load_feedback,
+)
+
+
+def _entry(action: AnalystAction, notes: str | None = None) -> FeedbackEntry:
+    return FeedbackEntry(
+        card_url="https://example.com",
+        company="Acme",
+        discrepancy_type="licensing_mismatch",
+        analyst_action=action,
+        notes=notes,
+    )
+
+
+def test_load_feedback_matches_strict_validation(tmp_path):
+    """Trusted fast path yields the same entries as full validation."""
+    events_path = tmp_path / "events.jsonl"
+    with FeedbackLogger(events_path) as feedback_log:
+        feedback_log.log(_entry(AnalystAction.CONFIRM, notes="verified"))
+        feedback_log.log(_entry(AnalystAction.DISMISS))
+
+    fast = load_feedback(events_path)
+    strict = load_feedback(events_path, strict=True)
+
+    assert fast == strict
+    assert fast[0].analyst_action is AnalystAction.CONFIRM
+    assert compute_rule_adjustments(fast)["licensing_mismatch"]["sample_size"] == 2
+
+
+def test_load_feedback_missing_file(tmp_path):
+    """Missing log yields no entries."""
+    assert load_feedback(tmp_path / "missing.jsonl") == []
+
+
+def test_feedback_logger_close_after_failed_init(tmp_path, monkeypatch):
+    """A logger whose directory could not be created still closes cleanly."""
+    blocker = tmp_path / "not_a_dir"
+    blocker.write_text("")
+    monkeypatch.setattr(feedback_module, "FEEDBACK_DIR", blocker / "feedback")
+
+    feedback_log = FeedbackLogger.__new__(FeedbackLogger)
+    with pytest.raises(OSError):
+        feedback_log.__init__(tmp_path / "events.jsonl")
+    feedback_log.close()
@@ -1,12 +1,20 @@
 """Tests for ingestion module."""
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from src.iva.ingestion import fetch as fetch_module
 from src.iva.ingestion.fetch import fetch_html, fetch_rendered
 from src.iva.ingestion.parse import fetch_pdf_text, html_to_text
 
 
+@pytest.fixture(autouse=True)
+def reset_shared_client(monkeypatch):
+    """Tests patch the HTTP client and Playwright, so never reuse shared instances."""
+    monkeypatch.setattr(fetch_module, "_client", None)
+    monkeypatch.setattr(fetch_module, "_browser_loop", None)
+
+
 @pytest.mark.asyncio
 @patch("httpx.AsyncClient")
 async def test_fetch_html(mock_client):
@@ -29,20 +37,27 @@ async def test_fetch_html(mock_client):
 @patch("playwright.async_api.async_playwright")
 async def test_fetch_rendered(mock_playwright):
     """Test rendered HTML fetching."""
-    mock_browser = AsyncMock()
     mock_page = AsyncMock()
     mock_page.content = AsyncMock(return_value="<html>Rendered</html>")
     mock_page.goto = AsyncMock()
-    mock_browser.new_page.return_value = mock_page
-    mock_browser.close = AsyncMock()
+    mock_context = AsyncMock()
+    mock_context.new_page.return_value = mock_page
+
+    mock_browser = AsyncMock()
+    mock_browser.is_connected = MagicMock(return_value=True)
+    mock_browser.new_context.return_value = mock_context
 
     mock_p = AsyncMock()
     mock_p.chromium.launch.return_value = mock_browser
-    mock_playwright.return_value.__aenter__.return_value = mock_p
-    mock_playwright.return_value.__aexit__.return_value = None
+    mock_playwright.return_value.start = AsyncMock(return_value=mock_p)
 
     result = await fetch_rendered("http://test.com")
     assert result == "<html>Rendered</html>"
+    mock_context.close.assert_awaited_once()
+
+    # The warm browser is reused for subsequent renders
+    await fetch_rendered("http://test.com/other")
+    mock_p.chromium.launch.assert_awaited_once()
 
 
 def test_html_to_text():
@@ -65,6 +80,14 @@ def test_html_to_text():
     assert "color: red" not in text  # Styles removed
 
 
+def test_html_to_text_max_chars():
+    """Test truncation matches normalising the full text and slicing."""
+    html = "<html><body>" + "<p>word   spaced\n out</p>" * 200 + "</body></html>"
+    full = html_to_text(html)
+    assert html_to_text(html, max_chars=50) == full[:50]
+    assert html_to_text(html, max_chars=10_000) == full
+
+
 def test_html_to_text_strips_whitespace():
     """Test that HTML to text strips excessive whitespace."""
     html = "<p>Line   1</p><p>Line   2</p>"
@@ -97,27 +120,93 @@ async def test_fetch_pdf_text(mock_client):
     """Test PDF text extraction."""
     from io import BytesIO
 
-    from pypdf import PdfWriter
+    import pypdfium2 as pdfium
 
     # Create a mock PDF
-    pdf_writer = PdfWriter()
-    pdf_writer.add_blank_page(width=612, height=792)
+    pdf = pdfium.PdfDocument.new()
+    pdf.new_page(612, 792)
     pdf_buffer = BytesIO()
-    pdf_writer.write(pdf_buffer)
+    pdf.save(pdf_buffer)
     pdf_bytes = pdf_buffer.getvalue()
 
-    mock_response = AsyncMock()
-    mock_response.content = pdf_bytes
-    mock_response.raise_for_status = AsyncMock()
+    mock_response = MagicMock()
+    mock_response.aread = AsyncMock(return_value=pdf_bytes)
 
     mock_client_instance = AsyncMock()
     mock_client_instance.__aenter__.return_value = mock_client_instance
     mock_client_instance.__aexit__.return_value = None
-    mock_client_instance.get.return_value = mock_response
+    mock_client_instance.stream = MagicMock()
+    mock_client_instance.stream.return_value.__aenter__.return_value = mock_response
     mock_client.return_value = mock_client_instance
 
     result = await fetch_pdf_text("http://test.com/file.pdf")
     assert isinstance(result, str)
+    mock_response.raise_for_status.assert_called_once()
+
+
+def _text_pdf(text: str) -> bytes:
+    """Build a one-page PDF whose page shows `text` in Helvetica."""
+    content = f"BT /F1 24 Tf 72 700 Td ({text}) Tj ET".encode()
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Contents 4 0 R "
+        b"/Resources << /Font << /F1 5 0 R >> >> >>",
+        b"<< /Length %d >>\nstream\n" % len(content) + content + b"\nendstream",
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    out = b"%PDF-1.4\n"
+    offsets = []
+    for i, obj in enumerate(objects, 1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n" % i + obj + b"\nendobj\n"
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    out += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (
+        len(objects) + 1,
+        xref,
+    )
+    return out
+
+
+@pytest.mark.asyncio
+async def test_pdf_to_text_concurrent_calls_are_serialised(monkeypatch):
+    """Concurrent extractions never run PDFium in two threads at once."""
+    import asyncio
+    import threading
+    import time
+
+    from src.iva.ingestion import parse as parse_module
+
+    real_document = parse_module.pdfium.PdfDocument
+    state_lock = threading.Lock()
+    active = 0
+    max_active = 0
+
+    class TrackingDocument(real_document):
+        def __init__(self, *args, **kwargs):
+            nonlocal active, max_active
+            with state_lock:
+                active += 1
+                max_active = max(max_active, active)
+            time.sleep(0.01)  # Widen the window for an overlapping extraction
+            super().__init__(*args, **kwargs)
+
+        def close(self):
+            nonlocal active
+            super().close()
+            with state_lock:
+                active -= 1
+
+    monkeypatch.setattr(parse_module.pdfium, "PdfDocument", TrackingDocument)
+
+    texts = [f"Report {i}" for i in range(8)]
+    results = await asyncio.gather(
+        *(asyncio.to_thread(parse_module._pdf_to_text, _text_pdf(t)) for t in texts)
+    )
+    assert [r.strip() for r in results] == texts
+    assert max_active == 1
 
 
 @pytest.mark.asyncio
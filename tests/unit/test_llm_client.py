@@ -0,0 +1,35 @@
+"""Tests for the LLM client helpers."""
+import threading
+import time
+
+import pytest
+
+import src.iva.llm.client as client_module
+
+
+@pytest.mark.asyncio
+async def test_json_call_many_preserves_order_and_bounds_concurrency(monkeypatch):
+    """Results follow prompt order, failures are returned in place, and fan-out is capped."""
+    lock = threading.Lock()
+    active = peak = 0
+
+    def fake_json_call(prompt, schema):
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.01)
+        with lock:
+            active -= 1
+        if prompt == "bad":
+            raise ValueError("malformed")
+        return {"prompt": prompt}
+
+    monkeypatch.setattr(client_module, "json_call", fake_json_call)
+
+    prompts = ["a", "bad", "c", "d", "e"]
+    results = await client_module.json_call_many(prompts, {"type": "object"}, concurrency=2)
+
+    assert [r["prompt"] for r in results if isinstance(r, dict)] == ["a", "c", "d", "e"]
+    assert isinstance(results[1], ValueError)
+    assert peak <= 2
@@ -102,3 +102,11 @@ def test_marketing_discrepancy_deduplicates_claims():
         "We process hundreds of billions",
     }
     assert "Also flagged claim" in (marketing[0].explanation.notes or "")
+
+
+def test_reconcile_uses_given_timestamp():
+    now = datetime(2024, 1, 2, tzinfo=UTC)
+    cs = ClaimSet(url="u", company="c", extracted_at=now, claims=[])
+    card = reconcile(cs, {}, now=now)
+    assert card.generated_at == now
+    assert card.severity_summary == "H:0 • M:0 • L:0"